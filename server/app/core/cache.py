@@ -0,0 +1,91 @@
+"""
+Redis-backed cache used by the services for read-through lookups.
+
+Caching is enabled only when REDIS_URL is configured. Without it, or when
+Redis can't be reached, every helper behaves as a cache miss so callers
+always fall back to the database.
+"""
+
+import logging
+from typing import Optional
+
+import redis
+
+from app.core.config import Settings
+
+logger = logging.getLogger(__name__)
+
+redis_client = (
+    redis.Redis.from_url(
+        Settings.REDIS_URL,
+        socket_timeout=Settings.CACHE_TIMEOUT,
+        socket_connect_timeout=Settings.CACHE_TIMEOUT,
+    )
+    if Settings.REDIS_URL
+    else None
+)
+
+
+def cache_get(key: str, field: Optional[str] = None) -> Optional[bytes]:
+    """Retrieve a cached value.
+
+    Args:
+        key (str): Cache key
+        field (Optional[str]): Field inside the hash stored at key, for
+            groups of values that are invalidated together
+
+    Returns:
+        Optional[bytes]: The cached value, or None on a miss
+    """
+    if redis_client is None:
+        return None
+    try:
+        if field is not None:
+            return redis_client.hget(key, field)
+        return redis_client.get(key)
+    except redis.RedisError as e:
+        logger.warning("Failed to read cache key %s: %s", key, str(e))
+        return None
+
+
+def cache_set(
+    key: str,
+    value: str,
+    field: Optional[str] = None,
+    ttl: int = Settings.CACHE_TTL,
+) -> None:
+    """Store a value in the cache with an expiration.
+
+    Args:
+        key (str): Cache key
+        value (str): Serialized value to store
+        field (Optional[str]): Field inside the hash stored at key; the
+            expiration then applies to the whole hash
+        ttl (int): Time to live in seconds
+    """
+    if redis_client is None:
+        return
+    try:
+        if field is not None:
+            with redis_client.pipeline() as pipe:
+                pipe.hset(key, field, value)
+                pipe.expire(key, ttl)
+                pipe.execute()
+        else:
+            redis_client.set(key, value, ex=ttl)
+    except redis.RedisError as e:
+        logger.warning("Failed to write cache key %s: %s", key, str(e))
+
+
+def cache_delete(*keys: str) -> None:
+    """Invalidate cached values.
+
+    Args:
+        *keys (str): Cache keys to remove
+    """
+    if redis_client is None or not keys:
+        return
+    try:
+        redis_client.delete(*keys)
+    except redis.RedisError as e:
+        logger.warning("Failed to delete cache keys %s: %s", keys, str(e))
@@ -22,11 +22,35 @@ class Settings:
 
     DB_URL = f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
 
+    # Connection pool tuning
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE") or 20)
+    DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW") or 10)
+    DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT") or 30)
+    DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE") or 3600)
+    # Set when connecting through PgBouncer, which then does the pooling
+    DB_USE_PGBOUNCER = (os.getenv("DB_USE_PGBOUNCER") or "").lower() == "true"
+
     # Test DB variables
     TEST_DB = DB_NAME + "_TEST"
     TEST_DB_URI = (
         f"postgresql://{DB_USER}:{DB_PASSWORD}@" f"{DB_HOST}:{DB_PORT}/{TEST_DB}"
     )
+    # Run the tests against an in-memory SQLite database instead of Postgres
+    TEST_DB_SQLITE = (os.getenv("TEST_DB_SQLITE") or "").lower() == "true"
+
+    ### SERVER VARIABLES ###
+    # Sync routes run in anyio's worker threads, 40 by default. Nearly all of
+    # them hold a database connection, so match the most the pool hands out;
+    # extra threads would only wait out DB_POOL_TIMEOUT and fail
+    THREADPOOL_SIZE = int(
+        os.getenv("THREADPOOL_SIZE") or DB_POOL_SIZE + DB_MAX_OVERFLOW
+    )
+
+    ### CACHE VARIABLES ###
+    REDIS_URL = os.getenv("REDIS_URL")
+    CACHE_TTL = int(os.getenv("CACHE_TTL") or 300)
+    # Seconds to wait on Redis before treating the call as a cache miss
+    CACHE_TIMEOUT = float(os.getenv("CACHE_TIMEOUT") or 0.1)
 
     ### AUTHENTICATION VARIABLES ###
     JWT_SECRET = os.getenv("JWT_SECRET")
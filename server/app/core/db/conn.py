@@ -4,6 +4,9 @@ from typing import Annotated
 import logging
 import psycopg2
 from fastapi import Depends
+from sqlalchemy import text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 from sqlmodel import SQLModel, create_engine, Session
 
 from app.core.config import Settings
@@ -42,7 +45,21 @@ def ensure_database_exists():
 
 
 # Create engine after ensuring database exists
-engine = create_engine(Settings.DB_URL)
+# A single module-level engine so every request shares the same pool;
+# pre-ping discards connections dropped by the server before they are used.
+# Behind PgBouncer the app keeps no pool of its own and opens a connection
+# to the bouncer per checkout instead
+if Settings.DB_USE_PGBOUNCER:
+    engine = create_engine(Settings.DB_URL, poolclass=NullPool)
+else:
+    engine = create_engine(
+        Settings.DB_URL,
+        pool_size=Settings.DB_POOL_SIZE,
+        max_overflow=Settings.DB_MAX_OVERFLOW,
+        pool_timeout=Settings.DB_POOL_TIMEOUT,
+        pool_recycle=Settings.DB_POOL_RECYCLE,
+        pool_pre_ping=True,
+    )
 
 
 def create_db_and_tables():
@@ -52,9 +69,36 @@ def create_db_and_tables():
     logger.info("Tables created successfully")
 
 
+def warm_connection_pool():
+    """Open the pool's base connections up front so early requests skip the handshake"""
+    if Settings.DB_USE_PGBOUNCER:
+        return
+    connections = []
+    try:
+        for _ in range(Settings.DB_POOL_SIZE):
+            connection = engine.connect()
+            connection.execute(text("SELECT 1"))
+            connections.append(connection)
+    finally:
+        # Closing returns each connection to the pool, where it stays open
+        for connection in connections:
+            connection.close()
+    logger.info("Warmed %d database connections", len(connections))
+
+
+# Responses are serialized after the service commits; keeping the loaded
+# state avoids a refresh SELECT for rows that came back via RETURNING
+SessionLocal = sessionmaker(bind=engine, class_=Session, expire_on_commit=False)
+
+
 def get_session():
-    """Instantiate the session and yield it as a dependency"""
-    with Session(engine) as session:
+    """Instantiate the session and yield it as a dependency.
+
+    FastAPI caches the dependency per request, so every dependency and the
+    handler share this one session. Closing it when the request ends hands
+    its connection back to the pool.
+    """
+    with SessionLocal() as session:
         yield session
 
 
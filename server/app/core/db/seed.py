@@ -8,6 +8,7 @@ from typing import List, Dict, Any, Callable
 import bcrypt
 from sqlmodel import Session, select
 
+from app.core.utils.dates import utc_now
 from app.services.order.model import Order, OrderItem, OrderStatus, PaymentStatus
 from app.services.product.model import Product, ProductCategory, ProductStatus
 
@@ -151,7 +152,7 @@ def get_minimal_products() -> List[Product]:
             rating=4.8,
             stock=25,
             status=ProductStatus.ACTIVE,
-            created_at=datetime.utcnow(),
+            created_at=utc_now(),
             views_count=120,
             sales_count=17,
             discount_percentage=0.0,
@@ -167,7 +168,7 @@ def get_minimal_products() -> List[Product]:
             rating=4.5,
             stock=50,
             status=ProductStatus.ACTIVE,
-            created_at=datetime.utcnow(),
+            created_at=utc_now(),
             views_count=85,
             sales_count=12,
             discount_percentage=5.0,
@@ -183,7 +184,7 @@ def get_minimal_products() -> List[Product]:
             rating=4.6,
             stock=30,
             status=ProductStatus.ACTIVE,
-            created_at=datetime.utcnow(),
+            created_at=utc_now(),
             views_count=95,
             sales_count=8,
             discount_percentage=0.0,
@@ -203,7 +204,7 @@ def get_minimal_products() -> List[Product]:
             rating=4.7,
             stock=40,
             status=ProductStatus.ACTIVE,
-            created_at=datetime.utcnow(),
+            created_at=utc_now(),
             views_count=110,
             sales_count=22,
             discount_percentage=0.0,
@@ -219,7 +220,7 @@ def get_minimal_products() -> List[Product]:
             rating=4.9,
             stock=15,
             status=ProductStatus.ACTIVE,
-            created_at=datetime.utcnow(),
+            created_at=utc_now(),
             views_count=150,
             sales_count=14,
             discount_percentage=10.0,
@@ -235,7 +236,7 @@ def get_minimal_products() -> List[Product]:
             rating=4.8,
             stock=10,
             status=ProductStatus.ACTIVE,
-            created_at=datetime.utcnow(),
+            created_at=utc_now(),
             views_count=75,
             sales_count=6,
             discount_percentage=0.0,
@@ -248,7 +249,7 @@ def get_minimal_products() -> List[Product]:
 
 def get_minimal_orders() -> List[Order]:
     """Return a minimal list of orders for demo data"""
-    now = datetime.utcnow()
+    now = utc_now()
     week_ago = datetime(now.year, now.month, now.day - 7)
 
     orders = [
@@ -269,7 +270,7 @@ def get_minimal_orders() -> List[Order]:
             },
             shipping_method="Standard Shipping",
             tracking_number="TN78901234",
-            estimated_delivery=datetime.utcnow(),
+            estimated_delivery=utc_now(),
             subtotal=1089.98,
             tax_amount=108.99,
             shipping_cost=15.00,
@@ -4,8 +4,11 @@ from typing import TYPE_CHECKING, List, Optional
 from enum import StrEnum
 from datetime import datetime
 from pydantic import EmailStr
+from sqlalchemy import Index
 from sqlmodel import Field, Relationship, SQLModel, Column, JSON
 
+from app.core.utils.dates import utc_now
+
 if TYPE_CHECKING:
     from app.services.product.model import Product
     from app.services.order.model import Order
@@ -61,7 +64,7 @@ class UserSystemFields(SQLModel):
 
     password_hash: str = ""
     status: UserStatus = UserStatus.ACTIVE
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utc_now)
     last_login: Optional[datetime] = None
 
 
@@ -85,6 +88,11 @@ class UserBase(UserCreateBase, UserSystemFields):
 class Vendor(UserBase, table=True):
     """Vendor table"""
 
+    __table_args__ = (
+        Index("ix_vendor_email", "email", unique=True),
+        Index("ix_vendor_created_id", "created_at", "id"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     rating: Optional[float] = None
     bank_info: dict = Field(default={}, sa_column=Column(JSON))
@@ -153,6 +161,11 @@ class VendorUpdate(SQLModel):
 class Shopper(UserBase, table=True):
     """Shopper table"""
 
+    __table_args__ = (
+        Index("ix_shopper_email", "email", unique=True),
+        Index("ix_shopper_created_id", "created_at", "id"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     preferences: dict = Field(default={}, sa_column=Column(JSON))
     payment_methods: List[dict] = Field(default=[], sa_column=Column(JSON))
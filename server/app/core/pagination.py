@@ -0,0 +1,89 @@
+"""
+Cursor-based (keyset) pagination helpers.
+
+List endpoints return a Page with the items and an opaque cursor pointing
+after the last item. The cursor encodes the (created_at, id) sort key, so
+the next page is fetched with an indexed range condition instead of an
+OFFSET that has to walk every skipped row.
+"""
+
+import base64
+import binascii
+from datetime import datetime
+from typing import Any, Generic, List, Optional, Sequence, Tuple, TypeVar
+
+from pydantic import BaseModel, computed_field
+
+from app.core.utils.exceptions import BadRequest
+
+T = TypeVar("T")
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 100
+
+
+class Page(BaseModel, Generic[T]):
+    """A page of results and the cursor for requesting the next one"""
+
+    items: List[T]
+    next_cursor: Optional[str] = None
+
+    @computed_field
+    @property
+    def has_next(self) -> bool:
+        """Whether another page follows this one"""
+        return self.next_cursor is not None
+
+
+def encode_cursor(created_at: datetime, item_id: int) -> str:
+    """Encode a keyset position into an opaque cursor.
+
+    Args:
+        created_at (datetime): Creation time of the last item on the page
+        item_id (int): ID of the last item on the page
+
+    Returns:
+        str: URL-safe cursor string
+    """
+    raw = f"{created_at.isoformat()}|{item_id}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor (str): Cursor received from the client
+
+    Returns:
+        Tuple[datetime, int]: The (created_at, id) keyset position
+
+    Raises:
+        BadRequest: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        created_at, item_id = raw.split("|")
+        return datetime.fromisoformat(created_at), int(item_id)
+    except (ValueError, UnicodeError, binascii.Error) as e:
+        raise BadRequest(detail="Invalid pagination cursor") from e
+
+
+def split_page(rows: Sequence[Any], limit: int) -> Tuple[Sequence[Any], Optional[str]]:
+    """Split the result of a query run with limit + 1 into a page and its cursor.
+
+    Fetching one row more than requested tells whether a next page exists
+    without a COUNT, and avoids handing out a cursor to an empty page.
+
+    Args:
+        rows (Sequence[Any]): Rows ordered by (created_at, id), at most limit + 1
+        limit (int): Number of items in a page
+
+    Returns:
+        Tuple[Sequence[Any], Optional[str]]: The rows of the page and the
+            cursor for the next page, or None if this is the last one
+    """
+    if len(rows) <= limit:
+        return rows, None
+    last = rows[limit - 1]
+    return rows[:limit], encode_cursor(last.created_at, last.id)
@@ -7,16 +7,33 @@ specific repository implementations.
 """
 
 import logging
-from typing import List, Any, TypeVar, Type
-from sqlmodel import Session, SQLModel, select, update
+from datetime import datetime
+from typing import List, Any, Optional, Sequence, Tuple, TypeVar, Type
+from sqlalchemy import tuple_
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, SQLModel, delete, select, update
 
-from app.core.utils.exceptions import BadRequest
+from app.core.utils.exceptions import BadRequest, Conflict
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T", bound=SQLModel)
 
 
+def _update_values(model: Type[SQLModel], data: Any) -> dict:
+    """Map the fields a client explicitly sent to the model's column values.
+
+    Fields that aren't columns, such as relationships, are left out, and so
+    are nulls sent for NOT NULL columns, which leave the stored value as is.
+    """
+    columns = model.__table__.columns
+    return {
+        key: value
+        for key, value in data.model_dump(exclude_unset=True).items()
+        if key in columns and (value is not None or columns[key].nullable)
+    }
+
+
 class BaseRepository:
     """Base repository class for database operations.
 
@@ -41,42 +58,76 @@ class BaseRepository:
         Returns:
             T: The newly created model instance
 
+        Raises:
+            Exception: If there is an error creating the item
+        """
+        return self.save_item(model(**model_data.model_dump()))
+
+    def save_item(self, item: T) -> T:
+        """Persist an already constructed model instance.
+
+        Args:
+            item (T): The model instance to insert
+
+        Returns:
+            T: The same instance, refreshed with database generated values
+
         Raises:
             Exception: If there is an error creating the item
         """
         try:
-            new_item = model(**model_data.model_dump())
-            self.db.add(new_item)
+            self.db.add(item)
             self.db.commit()
-            self.db.refresh(new_item)
+            self.db.refresh(item)
             logger.info("Created item")
-            return new_item
+            return item
         except Exception as e:
             logger.error("Failed to add item %s", str(e))
             raise
 
-    def get_items(self, model: Type[T]) -> List[T]:
-        """Retrieve all items of the specified model from the database.
+    def get_items_keyset(
+        self,
+        model: Type[T],
+        limit: int,
+        after: Optional[Tuple[datetime, int]] = None,
+        *filters: Any,
+        options: Sequence[Any] = (),
+    ) -> List[T]:
+        """Retrieve a page of items, newest first, using keyset pagination.
 
         Args:
-            model (Type[SQLModel]): The SQLModel class to query
+            model (Type[SQLModel]): The SQLModel class to query, which must
+                have created_at and id columns
+            limit (int): Maximum number of items to return
+            after (Optional[Tuple[datetime, int]]): The (created_at, id) of the
+                last item of the previous page, or None for the first page
+            *filters (Any): Additional WHERE clauses to apply
+            options (Sequence[Any]): Loader options, e.g. selectinload() for
+                relationships that will be read from every item
 
         Returns:
-            List[T]: A list of all model instances found in the database
+            List[T]: The items of the requested page
         """
-        return self.db.scalars(select(model)).all()
+        stmt = select(model).where(*filters).options(*options)
+        if after is not None:
+            stmt = stmt.where(tuple_(model.created_at, model.id) < tuple_(*after))
+        stmt = stmt.order_by(model.created_at.desc(), model.id.desc()).limit(limit)
+        return self.db.scalars(stmt).all()
 
-    def get_item_id(self, model: Type[T], item_id: str) -> T:
+    def get_item_id(self, model: Type[T], item_id: int) -> T:
         """Retrieve a single item by its ID.
 
+        Session.get() returns the instance from the identity map when this
+        session already loaded it, and only queries the database otherwise.
+
         Args:
             model (Type[SQLModel]): The SQLModel class to query
-            item_id (str): The ID of the item to retrieve
+            item_id (int): The ID of the item to retrieve
 
         Returns:
             T: The model instance if found, otherwise None
         """
-        return self.db.scalar(select(model).where(model.id == item_id))
+        return self.db.get(model, item_id)
 
     def get_item_by_property(
         self, model: Type[T], db_property: str, item_property: str
@@ -101,15 +152,17 @@ class BaseRepository:
         Args:
             model (Type[SQLModel]): The SQLModel class of the item
             item (T): The item instance to update
-            data (Any): An object with model_dump method containing update data
+            data (Any): An object with model_dump method containing update data;
+                only the column fields that were explicitly set are written
 
         Returns:
             T: The updated model instance
 
         Raises:
             BadRequest: If no valid update data is provided
+            Conflict: If the update violates a constraint, e.g. a unique email
         """
-        update_data = {k: v for k, v in data.model_dump().items() if v is not None}
+        update_data = _update_values(model, data)
         if not update_data:
             logger.warning("Couldn't update model #%s", item.id)
             raise BadRequest(detail="No update data provided")
@@ -134,10 +187,102 @@ class BaseRepository:
 
             return item
 
+        except IntegrityError as e:
+            self.db.rollback()
+            logger.warning("Update of item #%s was rejected: %s", item.id, str(e))
+            raise Conflict(resource=model.__name__, resource_id=item.id) from e
+        except Exception as e:
+            logger.error("Error updating item: %s", str(e))
+            raise
+
+    def update_item_by_id(
+        self, model: Type[T], item_id: Any, data: Any, *filters: Any
+    ) -> Optional[T]:
+        """Update an item by its ID in a single round trip.
+
+        Issues ``UPDATE ... WHERE id = :id RETURNING *`` so the caller doesn't
+        need to load the item beforehand.
+
+        Args:
+            model (Type[T]): The SQLModel class of the item to update
+            item_id (Any): The unique identifier of the item
+            data (Any): The data to update the item with; only the column
+                fields that were explicitly set are written
+            *filters (Any): Additional WHERE clauses the item must satisfy,
+                e.g. an ownership check
+
+        Returns:
+            Optional[T]: The updated model instance, or None if no item matched
+
+        Raises:
+            BadRequest: If no valid update data is provided
+            Conflict: If the update violates a constraint, e.g. a unique email
+        """
+        update_data = _update_values(model, data)
+        if not update_data:
+            logger.warning("Couldn't update model #%s", item_id)
+            raise BadRequest(detail="No update data provided")
+
+        stmt = (
+            update(model)
+            .where(getattr(model, "id") == item_id, *filters)
+            .values(update_data)
+            .returning(model)
+        )
+        try:
+            item = self.db.execute(stmt).scalar_one_or_none()
+            self.db.commit()
+            return item
+        except IntegrityError as e:
+            self.db.rollback()
+            logger.warning("Update of item #%s was rejected: %s", item_id, str(e))
+            raise Conflict(resource=model.__name__, resource_id=item_id) from e
         except Exception as e:
+            self.db.rollback()
             logger.error("Error updating item: %s", str(e))
             raise
 
+    def delete_item_by_id(
+        self,
+        model: Type[T],
+        item_id: Any,
+        *filters: Any,
+        detach: Sequence[Any] = (),
+    ) -> Optional[int]:
+        """Delete an item by its ID without loading it first.
+
+        Args:
+            model (Type[T]): The SQLModel class of the item to delete
+            item_id (Any): The unique identifier of the item
+            *filters (Any): Additional WHERE clauses the item must satisfy,
+                e.g. an ownership check
+            detach (Sequence[Any]): Foreign key columns of child tables that
+                reference the item; they are set to NULL in the same
+                transaction, as the ORM does when deleting a loaded parent
+
+        Returns:
+            Optional[int]: The ID of the deleted item, or None if no item matched
+        """
+        model_id = getattr(model, "id")
+        target = select(model_id).where(model_id == item_id, *filters)
+        stmt = delete(model).where(model_id == item_id, *filters).returning(model_id)
+        try:
+            for foreign_key in detach:
+                self.db.execute(
+                    update(foreign_key.class_)
+                    .where(foreign_key.in_(target))
+                    .values({foreign_key.key: None})
+                )
+            deleted_id = self.db.execute(stmt).scalar_one_or_none()
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            logger.error("Error deleting item: %s", str(e))
+            raise
+        if deleted_id is not None:
+            logger.info("Deleted item #%s", deleted_id)
+        return deleted_id
+
     def delete_item(self, item: SQLModel) -> None:
         """Delete an item from the database.
 
@@ -0,0 +1,16 @@
+"""Date and time helpers shared across the app."""
+
+from datetime import datetime, timezone
+
+
+def utc_now() -> datetime:
+    """Return the current UTC time as a naive datetime.
+
+    Replaces the deprecated datetime.utcnow. The timestamp columns are
+    declared without a time zone, so values are stored as naive UTC; an
+    aware value would be shifted by the database session's TimeZone.
+
+    Returns:
+        datetime: The current time in UTC, without tzinfo
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
@@ -31,6 +31,20 @@ class NotFound(HTTPException):
         super().__init__(status_code=status.HTTP_404_NOT_FOUND, detail=message)
 
 
+class Conflict(HTTPException):
+    """Conflict exception, status 409"""
+
+    def __init__(
+        self, resource: str = "Resource", resource_id=None, detail: str = None
+    ):
+        message = detail or (
+            f"{resource} conflicts with an existing record"
+            if resource_id is None
+            else f"{resource} #{resource_id} conflicts with an existing record"
+        )
+        super().__init__(status_code=status.HTTP_409_CONFLICT, detail=message)
+
+
 class CredentialsException(HTTPException):
     """Credentials could not be validated"""
 
@@ -0,0 +1,45 @@
+"""Response classes for returning already validated pydantic data."""
+
+from typing import Any, Optional
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+
+class PydanticResponse(Response):
+    """JSON response rendered directly by pydantic-core.
+
+    FastAPI validates anything returned through a route's response_model
+    again before serializing it. Routes whose data was already validated
+    (e.g. by the service layer or read back from the cache) return this
+    response instead, which skips that pass. The route keeps its
+    response_model so the OpenAPI schema is unchanged.
+    """
+
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        content: Any,
+        adapter: Optional[TypeAdapter] = None,
+        status_code: int = 200,
+        exclude_none: bool = False,
+    ):
+        """Initialize the response.
+
+        Args:
+            content (Any): A pydantic model, or data matching the adapter's type
+            adapter (Optional[TypeAdapter]): Adapter used to serialize content
+                that isn't a single model, such as a list of models
+            status_code (int): HTTP status code of the response
+            exclude_none (bool): Leave out fields whose value is None
+        """
+        self.adapter = adapter
+        self.exclude_none = exclude_none
+        super().__init__(content=content, status_code=status_code)
+
+    def render(self, content: Any) -> bytes:
+        """Serialize the content to JSON bytes"""
+        if self.adapter is not None:
+            return self.adapter.dump_json(content, exclude_none=self.exclude_none)
+        return content.model_dump_json(exclude_none=self.exclude_none).encode("utf-8")
@@ -6,14 +6,17 @@ and defines the root endpoints.
 
 import logging
 from typing import Annotated
+from anyio import to_thread
 from fastapi import Depends, FastAPI
+from fastapi.responses import ORJSONResponse
 
 from fastapi.security import OAuth2PasswordRequestForm
 
 from .core.auth.current_user import ShopperUser
 from .core.auth.login import login_for_access_token
+from .core.config import Settings
 from .core.utils.logger import configure_logging, LogLevels
-from .core.db.conn import DbSession
+from .core.db.conn import DbSession, warm_connection_pool
 
 from .services.shopper.routes import router as shopper_router
 from .services.vendor.routes import router as vendor_router
@@ -31,6 +34,8 @@ app = FastAPI(
     title="E-Commerce API",
     description="Exercise done for Roadmap.sh Python roadmap",
     version="0.1.0",
+    # orjson serializes responses considerably faster than the stdlib encoder
+    default_response_class=ORJSONResponse,
 )
 
 app.include_router(shopper_router)
@@ -58,11 +63,15 @@ def setup_model_relationships():
 @app.on_event("startup")
 async def startup_db_client():
     """Create database and tables on startup"""
+    # The routes are sync and the session blocks, so concurrency is capped
+    # by the threadpool rather than the event loop
+    to_thread.current_default_thread_limiter().total_tokens = Settings.THREADPOOL_SIZE
     setup_model_relationships()
     # create_db_and_tables()
 
     # Seed the database with default profile
     seed_database()
+    await to_thread.run_sync(warm_connection_pool)
     logger.info("Database initialization complete")
 
 
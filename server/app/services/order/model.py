@@ -10,9 +10,11 @@ from datetime import datetime
 from enum import StrEnum
 from typing import TYPE_CHECKING, List, Optional
 
+from sqlalchemy import Index
 from sqlmodel import JSON, Column, Field, Relationship, SQLModel
 
 from app.core.db.user import Location
+from app.core.utils.dates import utc_now
 from app.services.product.model import Product
 
 if TYPE_CHECKING:
@@ -133,10 +135,13 @@ class Order(OrderBase, table=True):
     Inherits from OrderCreate and adds system-managed fields.
     """
 
+    # Serves order listings filtered by shopper and sorted by recency
+    __table_args__ = (Index("ix_order_shopper_created", "shopper_id", "created_at"),)
+
     id: Optional[int] = Field(default=None, primary_key=True)
     shopper_id: Optional[int] = Field(default=None, foreign_key="shopper.id")
     status: OrderStatus = OrderStatus.IN_PROGRESS
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utc_now)
     updated_at: Optional[datetime] = None
     delivered_at: Optional[datetime] = None
 
@@ -188,26 +193,26 @@ class OrderUpdate(SQLModel):
     All fields are optional to support partial updates.
     """
 
-    items: Optional[List[OrderItem]]
-    status: Optional[OrderStatus]
+    items: Optional[List[OrderItem]] = None
+    status: Optional[OrderStatus] = None
 
     # Payment info
-    payment_method: Optional[str]
-    payment_status: Optional[PaymentStatus]
+    payment_method: Optional[str] = None
+    payment_status: Optional[PaymentStatus] = None
 
     # Shipping info
-    delivery_location: Optional[Location]
-    shipping_method: Optional[str]
-    tracking_number: Optional[str]
-    estimated_delivery: Optional[datetime]
+    delivery_location: Optional[Location] = None
+    shipping_method: Optional[str] = None
+    tracking_number: Optional[str] = None
+    estimated_delivery: Optional[datetime] = None
 
     # Discounts and promotions
-    discount_code: Optional[str]
-    discount_amount: Optional[float]
+    discount_code: Optional[str] = None
+    discount_amount: Optional[float] = None
 
     # Tax and totals
-    subtotal: Optional[float]
-    tax_amount: Optional[float]
-    shipping_cost: Optional[float]
-    total_value: Optional[float]
-    updated_at: Optional[datetime]
+    subtotal: Optional[float] = None
+    tax_amount: Optional[float] = None
+    shipping_cost: Optional[float] = None
+    total_value: Optional[float] = None
+    updated_at: Optional[datetime] = None
@@ -7,8 +7,11 @@ data access methods.
 """
 
 import logging
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
+from sqlalchemy import insert
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import selectinload
 from app.core.repository import BaseRepository
 from app.services.order.model import Order, OrderItem, OrderItemCreate
 
@@ -26,6 +29,29 @@ class OrderRepository(BaseRepository):
         BaseRepository: Provides base CRUD operations for database entities
     """
 
+    def get_orders(
+        self,
+        limit: int,
+        after: Optional[Tuple[datetime, int]] = None,
+        shopper_id: Optional[int] = None,
+    ) -> List[Order]:
+        """Retrieve a page of orders, newest first, optionally filtered by shopper.
+
+        Args:
+            limit: Maximum number of orders to return
+            after: The (created_at, id) of the last order of the previous page
+            shopper_id: If given, only orders placed by this shopper are returned
+
+        Returns:
+            The list of orders in the requested page
+        """
+        filters = [] if shopper_id is None else [Order.shopper_id == shopper_id]
+        # Items for the whole page are loaded in one extra IN query
+        # rather than lazily per order while serializing
+        return self.get_items_keyset(
+            Order, limit, after, *filters, options=[selectinload(Order.items)]
+        )
+
     def create_order_with_items(
         self, order: Order, order_items: List[OrderItemCreate]
     ) -> Optional[Order]:
@@ -45,15 +71,15 @@ class OrderRepository(BaseRepository):
             self.db.add(order)
             self.db.flush()
 
-            for item_data in order_items:
-                item = OrderItem(
-                    order_id=order.id,
-                    product_id=item_data.product_id,
-                    quantity=item_data.quantity,
-                    unit_price=item_data.unit_price,
-                    total_price=item_data.total_price,
-                )
-                self.db.add(item)
+            # Core-level insert: a single multi-row INSERT without building
+            # OrderItem instances or going through the unit of work
+            self.db.execute(
+                insert(OrderItem),
+                [
+                    {**item_data.model_dump(), "order_id": order.id}
+                    for item_data in order_items
+                ],
+            )
 
             self.db.commit()
             self.db.refresh(order)
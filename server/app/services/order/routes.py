@@ -8,10 +8,13 @@ including order creation, retrieval, updating, and deletion.
 Routes require shopper authentication for operations that modify orders.
 """
 
-from fastapi import APIRouter, Depends, status
+from typing import Optional
+from fastapi import APIRouter, Depends, Query, status
 
 from app.core.auth.current_user import ShopperUser
 from app.core.db.conn import DbSession
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, Page
+from app.core.utils.responses import PydanticResponse
 from app.services.order.model import OrderPublic, OrderCreate, OrderUpdate
 
 # These exceptions are referenced in docstrings
@@ -26,9 +29,11 @@ from .service import OrderService
 router = APIRouter(prefix="/orders", tags=["orders"])
 
 
-def get_order_service(db: DbSession):
+async def get_order_service(db: DbSession):
     """Get an instance of the OrderService.
 
+    Async since it does no I/O, so it runs on the event loop, not the threadpool.
+
     Args:
         db (DbSession): Database session dependency
 
@@ -38,26 +43,37 @@ def get_order_service(db: DbSession):
     return OrderService(db)
 
 
-@router.get("/", response_model=list[OrderPublic])
-def get_orders(service: OrderService = Depends(get_order_service)):
-    """Retrieve a list of all orders.
+@router.get("/", response_model=Page[OrderPublic])
+def get_orders(
+    shopper_id: Optional[int] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    service: OrderService = Depends(get_order_service),
+):
+    """Retrieve a page of orders, newest first.
 
     Args:
+        shopper_id (Optional[int]): Only return orders placed by this shopper
+        cursor (Optional[str]): Cursor returned with the previous page
+        limit (int): Maximum number of orders in the page
         service (OrderService): Order service dependency
 
     Returns:
-        list[OrderPublic]: List of all orders
+        Page[OrderPublic]: The orders in the page and the cursor for the next one
+
+    Raises:
+        BadRequest: If the cursor is malformed (400)
     """
-    orders = service.get_orders()
-    return orders
+    orders = service.get_orders(limit, cursor, shopper_id)
+    return PydanticResponse(orders)
 
 
 @router.get("/{order_id}", response_model=OrderPublic)
-def get_order_id(order_id: str, service: OrderService = Depends(get_order_service)):
+def get_order_id(order_id: int, service: OrderService = Depends(get_order_service)):
     """Retrieve a specific order by its ID.
 
     Args:
-        order_id (str): Unique identifier of the order to retrieve
+        order_id (int): Unique identifier of the order to retrieve
         service (OrderService): Order service dependency
 
     Returns:
@@ -66,8 +82,8 @@ def get_order_id(order_id: str, service: OrderService = Depends(get_order_servic
     Raises:
         NotFound: If order with given ID doesn't exist (404)
     """
-    order = service.get_order_id(order_id)  # Fixed function call
-    return order
+    order = service.get_order_id(order_id)
+    return PydanticResponse(order)
 
 
 @router.post("/", response_model=OrderPublic)
@@ -98,7 +114,7 @@ def register_order(
 @router.patch("/{order_id}", response_model=OrderPublic)
 def update_order(
     shopper_user: ShopperUser,
-    order_id: str,
+    order_id: int,
     order_data: OrderUpdate,
     service: OrderService = Depends(get_order_service),
 ):
@@ -108,7 +124,7 @@ def update_order(
 
     Args:
         shopper_user (ShopperUser): Current authenticated shopper
-        order_id (str): Unique identifier of the order to update
+        order_id (int): Unique identifier of the order to update
         order_data (OrderUpdate): New data for the order
         service (OrderService): Order service dependency
 
@@ -126,7 +142,7 @@ def update_order(
 @router.delete("/{order_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_order(
     shopper_user: ShopperUser,
-    order_id: str,
+    order_id: int,
     service: OrderService = Depends(get_order_service),
 ):
     """Delete an order from the system.
@@ -135,7 +151,7 @@ def delete_order(
 
     Args:
         shopper_user (ShopperUser): Current authenticated shopper
-        order_id (str): Unique identifier of the order to delete
+        order_id (int): Unique identifier of the order to delete
         service (OrderService): Order service dependency
 
     Returns:
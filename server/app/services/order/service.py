@@ -7,9 +7,13 @@ acts as an intermediary between the API endpoints and the repository layer.
 """
 
 import logging
-from typing import List
+from functools import cached_property
+from typing import List, Optional
+from pydantic import TypeAdapter
 from sqlmodel import Session
 
+from app.core.cache import cache_delete, cache_get, cache_set
+from app.core.pagination import Page, decode_cursor, split_page
 from app.core.utils.exceptions import BadRequest, NotFound
 from app.services.order.model import (
     Order,
@@ -24,6 +28,25 @@ from app.services.product.service import ProductService
 
 logger = logging.getLogger(__name__)
 
+order_list_adapter = TypeAdapter(List[OrderPublic])
+OrderPage = Page[OrderPublic]
+
+
+def order_cache_key(order_id: int) -> str:
+    """Build the cache key for a single order"""
+    return f"order:{int(order_id)}"
+
+
+def order_list_cache_key(shopper_id: Optional[int] = None) -> str:
+    """Build the cache key holding the pages of an order listing.
+
+    Pages are stored as fields of a single hash so that deleting this
+    key invalidates every page of the listing at once.
+    """
+    if shopper_id is None:
+        return "orders:list"
+    return f"orders:list:shopper:{shopper_id}"
+
 
 class OrderService:
     """Service for managing order-related business operations.
@@ -43,40 +66,95 @@ class OrderService:
 
         self.db = db
         self.repository = OrderRepository(db)
-        self.product_service = ProductService(db)
 
-    def get_orders(self) -> List[OrderPublic]:
-        """Retrieve all orders from the database.
+    @cached_property
+    def product_service(self) -> ProductService:
+        """ProductService sharing this service's session.
 
-        Returns:
-            List[OrderPublic]: A list of all order instances
+        Built on first access, so requests that never touch products
+        (reads, updates, deletes) don't pay for it.
         """
-        return self.repository.get_items(Order)
+        return ProductService(self.db)
 
-    def get_order_id(self, order_id: str) -> OrderPublic:
-        """Retrieve an order by its ID.
+    def get_orders(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        shopper_id: Optional[int] = None,
+    ) -> OrderPage:
+        """Retrieve a page of orders, newest first, serving it from the cache when available.
+
+        Args:
+            limit (int): Maximum number of orders in the page
+            cursor (Optional[str]): Cursor returned with the previous page
+            shopper_id (Optional[int]): If given, only this shopper's orders are returned
+
+        Returns:
+            OrderPage: The orders in the page and the cursor for the next one
+
+        Raises:
+            BadRequest: If the cursor is malformed
+        """
+        cache_key = order_list_cache_key(shopper_id)
+        cache_field = f"{limit}:{cursor}"
+        cached = cache_get(cache_key, cache_field)
+        if cached is not None:
+            return OrderPage.model_validate_json(cached)
+
+        after = decode_cursor(cursor) if cursor else None
+        rows = self.repository.get_orders(limit + 1, after, shopper_id)
+        orders, next_cursor = split_page(rows, limit)
+        page = OrderPage(
+            items=order_list_adapter.validate_python(orders, from_attributes=True),
+            next_cursor=next_cursor,
+        )
+        cache_set(cache_key, page.model_dump_json(), cache_field)
+        return page
+
+    def get_order_id(self, order_id: int) -> OrderPublic:
+        """Retrieve an order by its ID, serving it from the cache when available.
 
         Args:
-            order_id (str): The unique identifier of the order
+            order_id (int): The unique identifier of the order
 
         Returns:
             OrderPublic: The order instance
 
+        Raises:
+            NotFound: If no order with the given ID exists
+        """
+        cached = cache_get(order_cache_key(order_id))
+        if cached is not None:
+            return OrderPublic.model_validate_json(cached)
+
+        order = OrderPublic.model_validate(self._get_order(order_id))
+        cache_set(order_cache_key(order_id), order.model_dump_json())
+        return order
+
+    def _get_order(self, order_id: int) -> Order:
+        """Retrieve an order database instance by its ID.
+
+        Args:
+            order_id (int): The unique identifier of the order
+
+        Returns:
+            Order: The order database instance
+
         Raises:
             NotFound: If no order with the given ID exists
         """
         order = self.repository.get_item_id(Order, order_id)
         if not order:
-            logger.warning("Order with id %s was not found", order_id)
+            logger.debug("Order with id %s was not found", order_id)
             raise NotFound(detail="Order not found")
 
         return order
 
-    def register_order(self, shopper_id: str, order_data: OrderCreate) -> OrderPublic:
+    def register_order(self, shopper_id: int, order_data: OrderCreate) -> OrderPublic:
         """Register a new order in the system.
 
         Args:
-            shopper_id (str): The unique identifier of the shopper creating the order
+            shopper_id (int): The unique identifier of the shopper creating the order
             order_data (OrderCreate): The data for creating the order
 
         Returns:
@@ -86,18 +164,21 @@ class OrderService:
             BadRequest: If a product in the order does not exist
         """
 
-        # Validate that all products exist
         order_items = order_data.ordered_items
         self._validate_and_prepare_order_items(order_items)
 
         order = Order(**order_data.model_dump(), shopper_id=shopper_id)
 
-        return self.repository.create_order_with_items(order, order_items)
+        created_order = self.repository.create_order_with_items(order, order_items)
+        cache_delete(order_list_cache_key(), order_list_cache_key(shopper_id))
+        return created_order
 
     def _validate_and_prepare_order_items(
         self, order_items: List[OrderItemCreate]
     ) -> None:
-        """Validate that all products in the order exist.
+        """Validate that all products in the order exist and fill in their prices.
+
+        Prices for every product in the order are fetched in a single query.
 
         Args:
             order_items (List[OrderItemCreate]): The list of items in the order
@@ -105,20 +186,22 @@ class OrderService:
         Raises:
             BadRequest: If a product in the order does not exist
         """
+        product_ids = [item.product_id for item in order_items]
+        prices = self.product_service.repository.get_prices(product_ids)
+        missing_ids = set(product_ids) - prices.keys()
+        if missing_ids:
+            logger.warning("Products with ids %s were not found", missing_ids)
+            raise BadRequest(detail=f"Product(s) {sorted(missing_ids)} not found")
+
         for item in order_items:
-            try:
-                _ = self.product_service.get_product_id(item.product_id)
-            except NotFound as exc:
-                logger.warning("Product with id %s was not found", item.product_id)
-                raise BadRequest(
-                    detail=f"Product with id {item.product_id} not found"
-                ) from exc
-
-    def update_order(self, order_id: str, update_data: OrderUpdate) -> OrderPublic:
+            item.unit_price = prices[item.product_id]
+            item.total_price = item.unit_price * item.quantity
+
+    def update_order(self, order_id: int, update_data: OrderUpdate) -> OrderPublic:
         """Update an order's information.
 
         Args:
-            order_id (str): The unique identifier of the order to update
+            order_id (int): The unique identifier of the order to update
             update_data (OrderUpdate): The data to update the order with
 
         Returns:
@@ -127,17 +210,22 @@ class OrderService:
         Raises:
             NotFound: If no order with the given ID exists
         """
-        order = self.get_order_id(order_id)
+        order = self._get_order(order_id)
         # TODO: update update_time property # pylint: disable=W0511
 
         updated_order = self.repository.update_item(Order, order, update_data)
+        cache_delete(
+            order_cache_key(order_id),
+            order_list_cache_key(),
+            order_list_cache_key(order.shopper_id),
+        )
         return updated_order
 
-    def delete_order(self, order_id: str) -> None:
+    def delete_order(self, order_id: int) -> None:
         """Delete an order from the system.
 
         Args:
-            order_id (str): The unique identifier of the order to delete
+            order_id (int): The unique identifier of the order to delete
 
         Returns:
             None
@@ -145,5 +233,11 @@ class OrderService:
         Raises:
             NotFound: If no order with the given ID exists
         """
-        order = self.get_order_id(order_id)
-        return self.repository.delete_item(order)
+        order = self._get_order(order_id)
+        shopper_id = order.shopper_id
+        self.repository.delete_item(order)
+        cache_delete(
+            order_cache_key(order_id),
+            order_list_cache_key(),
+            order_list_cache_key(shopper_id),
+        )
@@ -9,8 +9,11 @@ for product categories and statuses.
 from datetime import datetime
 from enum import StrEnum
 from typing import TYPE_CHECKING, List, Optional
+from sqlalchemy import Index
 from sqlmodel import JSON, Column, Field, Relationship, SQLModel
 
+from app.core.utils.dates import utc_now
+
 if TYPE_CHECKING:
     from app.core.db.user import Vendor
 
@@ -54,7 +57,7 @@ class ProductCreate(SQLModel):
     price: float
     description: str
     category: ProductCategory = ProductCategory.OTHER
-    tags: List[str] = Field(default=[], sa_column=Column(JSON))
+    tags: List[str] = Field(default_factory=list, sa_column=Column(JSON))
     sku: Optional[str] = Field(
         default=None, index=True
     )  # Optional but indexed for fast lookups
@@ -67,12 +70,17 @@ class Product(ProductCreate, table=True):
     Inherits from ProductCreate and adds system-managed fields.
     """
 
+    __table_args__ = (
+        Index("ix_product_created_id", "created_at", "id"),
+        Index("ix_product_vendor_id", "vendor_id", "id"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     vendor_id: Optional[int] = Field(default=None, foreign_key="vendor.id")
     rating: Optional[float] = None
     stock: Optional[int] = None
     status: ProductStatus = ProductStatus.ACTIVE
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utc_now)
     updated_at: Optional[datetime] = None
     views_count: int = 0
     sales_count: int = 0
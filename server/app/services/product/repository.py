@@ -7,10 +7,19 @@ data access methods.
 """
 
 import logging
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import bindparam
+from sqlmodel import select
+
 from app.core.repository import BaseRepository
+from app.services.product.model import Product
 
 logger = logging.getLogger(__name__)
 
+# Built once at import time; only the bound id changes between calls
+_PRODUCT_BY_ID = select(Product).where(Product.id == bindparam("product_id"))
+
 
 class ProductRepository(BaseRepository):
     """Repository for Product database operations.
@@ -22,3 +31,48 @@ class ProductRepository(BaseRepository):
     Inherits:
         BaseRepository: Provides base CRUD operations for database entities
     """
+
+    def get_product_id(self, product_id: int) -> Optional[Product]:
+        """Retrieve a single product by its ID.
+
+        Args:
+            product_id (int): The ID of the product to retrieve
+
+        Returns:
+            Optional[Product]: The product if found, otherwise None
+        """
+        return self.db.scalars(_PRODUCT_BY_ID, {"product_id": product_id}).first()
+
+    def get_products(
+        self, limit: int, after: Optional[Tuple[datetime, int]] = None
+    ) -> List[Product]:
+        """Retrieve a page of products, newest first.
+
+        Args:
+            limit (int): Maximum number of products to return
+            after (Optional[Tuple[datetime, int]]): The (created_at, id) of the
+                last product of the previous page, or None for the first page
+
+        Returns:
+            List[Product]: The products of the requested page
+        """
+        return self.get_items_keyset(Product, limit, after)
+
+    def get_prices(self, product_ids: List[int]) -> Dict[int, float]:
+        """Retrieve the current price of the given products in a single query.
+
+        Only the id and price columns are selected; products that don't
+        exist are simply absent from the result.
+
+        Args:
+            product_ids (List[int]): The product IDs to look up
+
+        Returns:
+            Dict[int, float]: Price of each product found, keyed by product ID
+        """
+        if not product_ids:
+            return {}
+        rows = self.db.execute(
+            select(Product.id, Product.price).where(Product.id.in_(product_ids))
+        )
+        return {product_id: price for product_id, price in rows}
@@ -9,10 +9,13 @@ Routes are divided into public endpoints and vendor-exclusive endpoints
 requiring vendor authentication.
 """
 
-from fastapi import APIRouter, Depends, status
+from typing import Optional
+from fastapi import APIRouter, Depends, Query, status
 
 from app.core.auth.current_user import VendorUser
 from app.core.db.conn import DbSession
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, Page
+from app.core.utils.responses import PydanticResponse
 from app.services.product.model import ProductPublic, ProductCreate, ProductUpdate
 
 # These exceptions are referenced in docstrings
@@ -27,9 +30,11 @@ from .service import ProductService
 router = APIRouter(prefix="/products", tags=["products"])
 
 
-def get_product_service(db: DbSession):
+async def get_product_service(db: DbSession):
     """Get an instance of the ProductService.
 
+    Async since it does no I/O, so it runs on the event loop, not the threadpool.
+
     Args:
         db (DbSession): Database session dependency
 
@@ -39,28 +44,37 @@ def get_product_service(db: DbSession):
     return ProductService(db)
 
 
-@router.get("/", response_model=list[ProductPublic])
-def get_products(service: ProductService = Depends(get_product_service)):
-    """Retrieve a list of all products.
+@router.get("/", response_model=Page[ProductPublic])
+def get_products(
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    service: ProductService = Depends(get_product_service),
+):
+    """Retrieve a page of products, newest first.
 
     Args:
+        cursor (Optional[str]): Cursor returned with the previous page
+        limit (int): Maximum number of products in the page
         service (ProductService): Product service dependency
 
     Returns:
-        list[ProductPublic]: List of all product profiles
+        Page[ProductPublic]: The products in the page and the cursor for the next one
+
+    Raises:
+        BadRequest: If the cursor is malformed (400)
     """
-    products = service.get_products()
-    return products
+    products = service.get_products(limit, cursor)
+    return PydanticResponse(products)
 
 
 @router.get("/{product_id}", response_model=ProductPublic)
 def get_product_id(
-    product_id: str, service: ProductService = Depends(get_product_service)
+    product_id: int, service: ProductService = Depends(get_product_service)
 ):
     """Retrieve a specific product by its ID.
 
     Args:
-        product_id (str): Unique identifier of the product to retrieve
+        product_id (int): Unique identifier of the product to retrieve
         service (ProductService): Product service dependency
 
     Returns:
@@ -104,7 +118,7 @@ def register_product(
 @router.patch("/{product_id}", response_model=ProductPublic)
 def update_product(
     vendor_user: VendorUser,
-    product_id: str,
+    product_id: int,
     product_data: ProductUpdate,
     service: ProductService = Depends(get_product_service),
 ):
@@ -114,7 +128,7 @@ def update_product(
 
     Args:
         vendor_user (VendorUser): Current authenticated vendor
-        product_id (str): Unique identifier of the product to update
+        product_id (int): Unique identifier of the product to update
         product_data (ProductUpdate): New data for the product
         service (ProductService): Product service dependency
 
@@ -122,17 +136,17 @@ def update_product(
         ProductPublic: The updated product
 
     Raises:
-        NotFound: If product with given ID doesn't exist (404)
+        NotFound: If the vendor has no product with the given ID (404)
         BadRequest: If no valid update data is provided (400)
         CredentialsException: If authentication fails (401)
     """
-    return service.update_product(product_id, product_data)
+    return service.update_product(product_id, vendor_user.id, product_data)
 
 
 @router.delete("/{product_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_product(
     vendor_user: VendorUser,
-    product_id: str,
+    product_id: int,
     service: ProductService = Depends(get_product_service),
 ):
     """Delete a product from the system.
@@ -141,14 +155,14 @@ def delete_product(
 
     Args:
         vendor_user (VendorUser): Current authenticated vendor
-        product_id (str): Unique identifier of the product to delete
+        product_id (int): Unique identifier of the product to delete
         service (ProductService): Product service dependency
 
     Returns:
         None
 
     Raises:
-        NotFound: If product with given ID doesn't exist (404)
+        NotFound: If the vendor has no product with the given ID (404)
         CredentialsException: If authentication fails (401)
     """
-    return service.delete_product(product_id)
+    return service.delete_product(product_id, vendor_user.id)
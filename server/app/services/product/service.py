@@ -7,9 +7,11 @@ acts as an intermediary between the API endpoints and the repository layer.
 """
 
 import logging
-from typing import List
+from typing import List, Optional
+from pydantic import TypeAdapter
 from sqlmodel import Session
 
+from app.core.pagination import Page, decode_cursor, split_page
 from app.core.utils.exceptions import NotFound
 from app.services.product.model import (
     Product,
@@ -21,6 +23,9 @@ from app.services.product.repository import ProductRepository
 
 logger = logging.getLogger(__name__)
 
+product_list_adapter = TypeAdapter(List[ProductPublic])
+ProductPage = Page[ProductPublic]
+
 
 class ProductService:
     """Service for managing product-related business operations.
@@ -40,19 +45,32 @@ class ProductService:
         self.db = db
         self.repository = ProductRepository(db)
 
-    def get_products(self) -> List[ProductPublic]:
-        """Retrieve all products from the database.
+    def get_products(self, limit: int, cursor: Optional[str] = None) -> ProductPage:
+        """Retrieve a page of products, newest first.
+
+        Args:
+            limit (int): Maximum number of products in the page
+            cursor (Optional[str]): Cursor returned with the previous page
 
         Returns:
-            List[ProductPublic]: A list of all product instances
-        """
-        return self.repository.get_items(Product)
+            ProductPage: The products in the page and the cursor for the next one
 
-    def get_product_id(self, product_id: str) -> ProductPublic:
+        Raises:
+            BadRequest: If the cursor is malformed
+        """
+        after = decode_cursor(cursor) if cursor else None
+        rows = self.repository.get_products(limit + 1, after)
+        products, next_cursor = split_page(rows, limit)
+        return ProductPage(
+            items=product_list_adapter.validate_python(products, from_attributes=True),
+            next_cursor=next_cursor,
+        )
+
+    def get_product_id(self, product_id: int) -> ProductPublic:
         """Retrieve a product by its ID.
 
         Args:
-            product_id (str): The unique identifier of the product
+            product_id (int): The unique identifier of the product
 
         Returns:
             ProductPublic: The product instance
@@ -60,20 +78,20 @@ class ProductService:
         Raises:
             NotFound: If no product with the given ID exists
         """
-        product = self.repository.get_item_id(Product, product_id)
+        product = self.repository.get_product_id(product_id)
         if not product:
-            logger.warning("Product with id %s was not found", product_id)
+            logger.debug("Product with id %s was not found", product_id)
             raise NotFound(detail="Product not found")
 
         return product
 
     def register_product(
-        self, vendor_id: str, product_data: ProductCreate
+        self, vendor_id: int, product_data: ProductCreate
     ) -> ProductPublic:
         """Register a new product in the system.
 
         Args:
-            vendor_id (str): The unique identifier of the vendor creating the product
+            vendor_id (int): The unique identifier of the vendor creating the product
             product_data (ProductCreate): The data for creating the product
 
         Returns:
@@ -82,42 +100,55 @@ class ProductService:
         Raises:
             BadRequest: If product data is invalid or missing required fields
         """
-        product = Product(**product_data.model_dump(), vendor_id=vendor_id)
-        result = self.repository.add_item(Product, product)
-        return result
+        # product_data was already validated by FastAPI, so its fields are
+        # copied shallowly instead of through model_dump, and the instance
+        # is saved as is rather than being dumped and rebuilt by add_item
+        product = Product(**dict(product_data), vendor_id=vendor_id)
+        return self.repository.save_item(product)
 
     def update_product(
-        self, product_id: str, update_data: ProductUpdate
+        self, product_id: int, vendor_id: int, update_data: ProductUpdate
     ) -> ProductPublic:
         """Update a product's information.
 
         Args:
-            product_id (str): The unique identifier of the product to update
+            product_id (int): The unique identifier of the product to update
+            vendor_id (int): The vendor performing the update, who must own the product
             update_data (ProductUpdate): The data to update the product with
 
         Returns:
             ProductPublic: The updated product instance
 
         Raises:
-            NotFound: If no product with the given ID exists
+            NotFound: If no product with the given ID is owned by the vendor
             BadRequest: If no valid update data is provided
         """
-        product = self.get_product_id(product_id)
-
-        updated_product = self.repository.update_item(Product, product, update_data)
+        # Ownership is checked by the UPDATE itself; a product owned by
+        # someone else is reported as missing rather than revealing it exists
+        updated_product = self.repository.update_item_by_id(
+            Product, product_id, update_data, Product.vendor_id == vendor_id
+        )
+        if not updated_product:
+            logger.debug("Product with id %s was not found", product_id)
+            raise NotFound(detail="Product not found")
         return updated_product
 
-    def delete_product(self, product_id: str) -> None:
+    def delete_product(self, product_id: int, vendor_id: int) -> None:
         """Delete a product from the system.
 
         Args:
-            product_id (str): The unique identifier of the product to delete
+            product_id (int): The unique identifier of the product to delete
+            vendor_id (int): The vendor performing the deletion, who must own the product
 
         Returns:
             None
 
         Raises:
-            NotFound: If no product with the given ID exists
+            NotFound: If no product with the given ID is owned by the vendor
         """
-        product = self.get_product_id(product_id)
-        return self.repository.delete_item(product)
+        deleted_id = self.repository.delete_item_by_id(
+            Product, product_id, Product.vendor_id == vendor_id
+        )
+        if deleted_id is None:
+            logger.debug("Product with id %s was not found", product_id)
+            raise NotFound(detail="Product not found")
@@ -7,10 +7,23 @@ data access methods.
 """
 
 import logging
+from datetime import datetime
+from typing import List, Optional, Tuple
+from sqlalchemy import bindparam
+from sqlalchemy.orm import load_only
+from sqlmodel import select
+
+from app.core.db.user import Shopper, ShopperPublic
 from app.core.repository import BaseRepository
 
 logger = logging.getLogger(__name__)
 
+_SHOPPER_BY_EMAIL = select(Shopper).where(Shopper.email == bindparam("email"))
+# Listings only need the columns exposed by ShopperPublic
+_PUBLIC_COLUMNS = load_only(
+    *(getattr(Shopper, field) for field in ShopperPublic.model_fields)
+)
+
 
 class ShopperRepository(BaseRepository):
     """Repository for Shopper database operations.
@@ -22,3 +35,42 @@ class ShopperRepository(BaseRepository):
     Inherits:
         BaseRepository: Provides base CRUD operations for database entities
     """
+
+    def get_public_shoppers(
+        self, limit: int, after: Optional[Tuple[datetime, int]] = None
+    ) -> List[Shopper]:
+        """Retrieve a page of shoppers, newest first, loading only their public columns.
+
+        Args:
+            limit (int): Maximum number of shoppers to return
+            after (Optional[Tuple[datetime, int]]): The (created_at, id) of the
+                last shopper of the previous page, or None for the first page
+
+        Returns:
+            List[Shopper]: The shoppers, with non-public columns left unloaded
+        """
+        return self.get_items_keyset(
+            Shopper, limit, after, options=[_PUBLIC_COLUMNS]
+        )
+
+    def get_shopper_id(self, shopper_id: int) -> Optional[Shopper]:
+        """Retrieve a single shopper by their ID.
+
+        Args:
+            shopper_id (int): The ID of the shopper to retrieve
+
+        Returns:
+            Optional[Shopper]: The shopper if found, otherwise None
+        """
+        return self.get_item_id(Shopper, shopper_id)
+
+    def get_shopper_email(self, email: str) -> Optional[Shopper]:
+        """Retrieve a single shopper by their email address.
+
+        Args:
+            email (str): The email address of the shopper
+
+        Returns:
+            Optional[Shopper]: The shopper if found, otherwise None
+        """
+        return self.db.scalars(_SHOPPER_BY_EMAIL, {"email": email}).first()
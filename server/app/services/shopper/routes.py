@@ -8,29 +8,35 @@ including user registration, profile management, and administrative functions.
 Routes are divided into protected (requiring authentication) and unprotected sections.
 """
 
-from fastapi import APIRouter, Depends, status
+from typing import Optional
+from fastapi import APIRouter, Depends, Query, status
 
 # Imported for dependency injection - used by FastAPI
 from app.core.auth.current_user import ShopperUser
 from app.core.auth.signup import register_shopper
 from app.core.db.conn import DbSession
 from app.core.db.user import ShopperCreate, ShopperPublic, ShopperUpdate
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, Page
+from app.core.utils.responses import PydanticResponse
 
 # These exceptions are referenced in docstrings
 from app.core.utils.exceptions import (
     BadRequest,
+    Conflict,
     NotFound,
     CredentialsException,
 )
 
-from .service import ShopperService
+from .service import ShopperService, shopper_public
 
 router = APIRouter(prefix="/shoppers", tags=["shoppers"])
 
 
-def get_shopper_service(db: DbSession):
+async def get_shopper_service(db: DbSession):
     """Get an instance of the ShopperService.
 
+    Async since it does no I/O, so it runs on the event loop, not the threadpool.
+
     Args:
         db (DbSession): Database session dependency
 
@@ -61,29 +67,39 @@ def add_shopper(db: DbSession, data: ShopperCreate):
 
 
 ### PROTECTED ROUTES ###
-@router.get("/", response_model=list[ShopperPublic])
+@router.get("/", response_model=Page[ShopperPublic])
 def get_shoppers(
-    current_user: ShopperUser, service: ShopperService = Depends(get_shopper_service)
+    current_user: ShopperUser,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    service: ShopperService = Depends(get_shopper_service),
 ):
-    """Retrieve a list of all shoppers.
+    """Retrieve a page of shoppers, newest first.
 
     Requires authentication as a shopper user.
 
     Args:
         current_user (ShopperUser): Current authenticated shopper
+        cursor (Optional[str]): Cursor returned with the previous page
+        limit (int): Maximum number of shoppers in the page
         service (ShopperService): Shopper service dependency
 
     Returns:
-        list[ShopperPublic]: List of all shopper profiles
+        Page[ShopperPublic]: The shoppers in the page and the cursor for the next one
+
+    Raises:
+        BadRequest: If the cursor is malformed (400)
     """
-    shoppers = service.get_shoppers()
-    return shoppers
+    # Rendered by pydantic-core, instead of going through jsonable_encoder
+    # and the response_model check
+    shoppers = service.get_shoppers(limit, cursor)
+    return PydanticResponse(shoppers)
 
 
 @router.get("/{shopper_id}", response_model=ShopperPublic)
 def get_shopper_id(
     current_user: ShopperUser,
-    shopper_id: str,
+    shopper_id: int,
     service: ShopperService = Depends(get_shopper_service),
 ):
     """Retrieve a specific shopper by their ID.
@@ -92,7 +108,7 @@ def get_shopper_id(
 
     Args:
         current_user (ShopperUser): Current authenticated shopper
-        shopper_id (str): Unique identifier of the shopper to retrieve
+        shopper_id (int): Unique identifier of the shopper to retrieve
         service (ShopperService): Shopper service dependency
 
     Returns:
@@ -103,13 +119,13 @@ def get_shopper_id(
         CredentialsException: If authentication fails (401)
     """
     shopper = service.get_shopper_id(shopper_id)
-    return shopper
+    return PydanticResponse(shopper, exclude_none=True)
 
 
 @router.patch("/{shopper_id}", response_model=ShopperPublic)
 def update_shopper(
     current_user: ShopperUser,
-    shopper_id: str,
+    shopper_id: int,
     update_data: ShopperUpdate,
     service: ShopperService = Depends(get_shopper_service),
 ):
@@ -119,7 +135,7 @@ def update_shopper(
 
     Args:
         current_user (ShopperUser): Current authenticated shopper
-        shopper_id (str): Unique identifier of the shopper to update
+        shopper_id (int): Unique identifier of the shopper to update
         update_data (ShopperUpdate): New data for the shopper profile
         service (ShopperService): Shopper service dependency
 
@@ -129,16 +145,17 @@ def update_shopper(
     Raises:
         NotFound: If shopper with given ID doesn't exist (404)
         BadRequest: If no valid update data is provided (400)
+        Conflict: If the email is already in use (409)
         CredentialsException: If authentication fails (401)
     """
     shopper = service.update_shopper(shopper_id, update_data)
-    return shopper
+    return PydanticResponse(shopper_public(shopper), exclude_none=True)
 
 
 @router.delete("/{shopper_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_shopper(
     current_user: ShopperUser,
-    shopper_id: str,
+    shopper_id: int,
     service: ShopperService = Depends(get_shopper_service),
 ):
     """Delete a shopper from the system.
@@ -147,7 +164,7 @@ def delete_shopper(
 
     Args:
         current_user (ShopperUser): Current authenticated shopper
-        shopper_id (str): Unique identifier of the shopper to delete
+        shopper_id (int): Unique identifier of the shopper to delete
         service (ShopperService): Shopper service dependency
 
     Returns:
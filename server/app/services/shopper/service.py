@@ -7,15 +7,46 @@ acts as an intermediary between the API endpoints and the repository layer.
 """
 
 import logging
-from typing import List
+from typing import Optional
 from sqlmodel import Session
 
-from app.core.db.user import Shopper, ShopperPublic, ShopperUpdate
+from app.core.cache import cache_delete, cache_get, cache_set
+from app.core.db.user import Location, Shopper, ShopperPublic, ShopperUpdate
+from app.core.pagination import Page, decode_cursor, split_page
 from app.core.utils.exceptions import NotFound
+from app.services.order.model import Order
 from .repository import ShopperRepository
 
 logger = logging.getLogger(__name__)
 
+ShopperPage = Page[ShopperPublic]
+
+
+def shopper_cache_key(shopper_id: int) -> str:
+    """Build the cache key for a single shopper"""
+    return f"shopper:{int(shopper_id)}"
+
+
+def shopper_public(shopper: Shopper) -> ShopperPublic:
+    """Build the public view of a shopper row without validating it again.
+
+    Rows read from the database already satisfy the schema, so their fields
+    are copied as they are. The JSON locations column holds plain dicts,
+    which are wrapped in Location so serialization sees the declared type.
+
+    Args:
+        shopper (Shopper): The shopper database instance
+
+    Returns:
+        ShopperPublic: The shopper's public fields
+    """
+    data = {field: getattr(shopper, field) for field in ShopperPublic.model_fields}
+    data["locations"] = [
+        loc if isinstance(loc, Location) else Location.model_construct(**loc)
+        for loc in shopper.locations or []
+    ]
+    return ShopperPublic.model_construct(**data)
+
 
 class ShopperService:
     """Service for managing shopper-related business operations.
@@ -35,19 +66,32 @@ class ShopperService:
         self.db = db
         self.repository = ShopperRepository(db)
 
-    def get_shoppers(self) -> List[ShopperPublic]:
-        """Retrieve all shoppers from the database.
+    def get_shoppers(self, limit: int, cursor: Optional[str] = None) -> ShopperPage:
+        """Retrieve a page of shoppers, newest first.
+
+        Args:
+            limit (int): Maximum number of shoppers in the page
+            cursor (Optional[str]): Cursor returned with the previous page
 
         Returns:
-            List[ShopperPublic]: A list of all shopper instances
+            ShopperPage: The shoppers in the page and the cursor for the next one
+
+        Raises:
+            BadRequest: If the cursor is malformed
         """
-        return self.repository.get_items(Shopper)
+        after = decode_cursor(cursor) if cursor else None
+        rows = self.repository.get_public_shoppers(limit + 1, after)
+        shoppers, next_cursor = split_page(rows, limit)
+        return ShopperPage(
+            items=[shopper_public(shopper) for shopper in shoppers],
+            next_cursor=next_cursor,
+        )
 
-    def get_shopper_id(self, shopper_id: str) -> ShopperPublic:
-        """Retrieve a shopper by their ID.
+    def get_shopper_id(self, shopper_id: int) -> ShopperPublic:
+        """Retrieve a shopper by their ID, serving it from the cache when available.
 
         Args:
-            shopper_id (str): The unique identifier of the shopper
+            shopper_id (int): The unique identifier of the shopper
 
         Returns:
             ShopperPublic: The shopper instance
@@ -55,9 +99,29 @@ class ShopperService:
         Raises:
             NotFound: If no shopper with the given ID exists
         """
-        shopper = self.repository.get_item_id(Shopper, shopper_id)
+        cached = cache_get(shopper_cache_key(shopper_id))
+        if cached is not None:
+            return ShopperPublic.model_validate_json(cached)
+
+        public = shopper_public(self._get_shopper(shopper_id))
+        cache_set(shopper_cache_key(shopper_id), public.model_dump_json())
+        return public
+
+    def _get_shopper(self, shopper_id: int) -> Shopper:
+        """Retrieve a shopper database instance by their ID.
+
+        Args:
+            shopper_id (int): The unique identifier of the shopper
+
+        Returns:
+            Shopper: The shopper database instance
+
+        Raises:
+            NotFound: If no shopper with the given ID exists
+        """
+        shopper = self.repository.get_shopper_id(shopper_id)
         if not shopper:
-            logger.warning("User with id %s was not found", shopper_id)
+            logger.debug("User with id %s was not found", shopper_id)
             raise NotFound(detail="User not found")
 
         return shopper
@@ -74,20 +138,20 @@ class ShopperService:
         Raises:
             NotFound: If no shopper with the given email exists
         """
-        shopper = self.repository.get_item_by_property(Shopper, "email", shopper_email)
+        shopper = self.repository.get_shopper_email(shopper_email)
         if not shopper:
-            logger.warning("User with email %s was not found", shopper_email)
+            logger.debug("User with email %s was not found", shopper_email)
             raise NotFound(detail="User not found")
 
         return shopper
 
     def update_shopper(
-        self, shopper_id: str, update_data: ShopperUpdate
+        self, shopper_id: int, update_data: ShopperUpdate
     ) -> ShopperPublic:
         """Update a shopper's information.
 
         Args:
-            shopper_id (str): The unique identifier of the shopper to update
+            shopper_id (int): The unique identifier of the shopper to update
             update_data (ShopperUpdate): The data to update the shopper with
 
         Returns:
@@ -96,17 +160,23 @@ class ShopperService:
         Raises:
             NotFound: If no shopper with the given ID exists
             BadRequest: If no valid update data is provided
+            Conflict: If the email is already in use
         """
-        shopper = self.get_shopper_id(shopper_id)
+        updated_shopper = self.repository.update_item_by_id(
+            Shopper, shopper_id, update_data
+        )
+        cache_delete(shopper_cache_key(shopper_id))
+        if not updated_shopper:
+            logger.debug("User with id %s was not found", shopper_id)
+            raise NotFound(detail="User not found")
 
-        updated_shopper = self.repository.update_item(Shopper, shopper, update_data)
         return updated_shopper
 
-    def delete_shopper(self, shopper_id: str) -> None:
+    def delete_shopper(self, shopper_id: int) -> None:
         """Delete a shopper from the system.
 
         Args:
-            shopper_id (str): The unique identifier of the shopper to delete
+            shopper_id (int): The unique identifier of the shopper to delete
 
         Returns:
             None
@@ -114,5 +184,10 @@ class ShopperService:
         Raises:
             NotFound: If no shopper with the given ID exists
         """
-        shopper = self.get_shopper_id(shopper_id)
-        return self.repository.delete_item(shopper)
+        deleted_id = self.repository.delete_item_by_id(
+            Shopper, shopper_id, detach=[Order.shopper_id]
+        )
+        cache_delete(shopper_cache_key(shopper_id))
+        if deleted_id is None:
+            logger.debug("User with id %s was not found", shopper_id)
+            raise NotFound(detail="User not found")
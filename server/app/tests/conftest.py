@@ -4,24 +4,51 @@
 """Conftest file to setup test db"""
 
 import logging
-from typing import Generator
+import os
+from typing import Generator, List
 
 from fastapi.testclient import TestClient
 import pytest
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, make_url, text
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 from sqlmodel import SQLModel, Session
+from app.core import cache
 from app.core.config import Settings
 
 # Import dependencies that need to be overridden
 from app.core.db.conn import get_session
 from app.main import app
 from app.core.db.user import Shopper, Vendor
+from app.tests.factories.products import ProductFactory
 from app.tests.factories.users import ShopperFactory, VendorFactory
+from app.tests.fakes import FakeRedis
 
 # Set up a test Database
-TEST_DB_URI = Settings.TEST_DB_URI
-engine = create_engine(TEST_DB_URI)
+# Each pytest-xdist worker gets a database of its own
+XDIST_WORKER = os.getenv("PYTEST_XDIST_WORKER")
+TEST_DB = f"{Settings.TEST_DB}_{XDIST_WORKER}" if XDIST_WORKER else Settings.TEST_DB
+TEST_DB_URI = make_url(Settings.TEST_DB_URI).set(database=TEST_DB)
+if Settings.TEST_DB_SQLITE:
+    # A single shared connection keeps the in-memory database alive and
+    # visible to the TestClient's worker thread
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        # pysqlite's own BEGIN handling breaks SAVEPOINTs; let SQLAlchemy emit it
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _begin_sqlite_transaction(conn):
+        conn.exec_driver_sql("BEGIN")
+
+else:
+    engine = create_engine(TEST_DB_URI)
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 logger = logging.getLogger(__name__)
@@ -29,7 +56,7 @@ logger = logging.getLogger(__name__)
 
 def create_test_database():
     """Create the test database if it doesn't exist"""
-    db_name = Settings.TEST_DB
+    db_name = TEST_DB
 
     # Create a connection string to the default postgres database
     postgres_uri = f"postgresql://{Settings.DB_USER}:{Settings.DB_PASSWORD}@{Settings.DB_HOST}:{Settings.DB_PORT}/postgres"  # pylint: disable=line-too-long
@@ -63,33 +90,95 @@ def setup_test_database():
     Create the test database schema before any tests run,
     and drop it after all tests are done.
     """
-    create_test_database()
+    if not Settings.TEST_DB_SQLITE:
+        create_test_database()
     SQLModel.metadata.create_all(bind=engine)
     yield
     SQLModel.metadata.drop_all(bind=engine)
 
 
-@pytest.fixture(scope="function")
-def db() -> Generator:
+SEEDED_SHOPPERS = 5
+
+
+@pytest.fixture(scope="session")
+def db_connection(setup_test_database) -> Generator:
     """
-    Create a new database session for each test and roll it back after the test.
+    Open one connection for the whole run inside a transaction that is
+    rolled back at the end, so rows seeded once are visible to every test.
     """
     connection = engine.connect()
     transaction = connection.begin()
-    session = TestingSessionLocal(bind=connection)
 
-    yield session
+    yield connection
 
-    session.close()
     transaction.rollback()
     connection.close()
 
 
+@pytest.fixture(scope="session")
+def seeded_shoppers(db_connection) -> List[Shopper]:
+    """
+    Insert a pool of shoppers once per run for tests that only need an
+    existing shopper. Tests may modify or delete them; each test's changes
+    are rolled back by the db fixture.
+    """
+    session = TestingSessionLocal(bind=db_connection, expire_on_commit=False)
+    ShopperFactory._meta.sqlalchemy_session = session
+    shoppers = ShopperFactory.create_batch_bulk(SEEDED_SHOPPERS, minimal=True)
+    # Detach them so tests can read their attributes from any session
+    session.expunge_all()
+    session.close()
+    return shoppers
+
+
+@pytest.fixture(scope="function")
+def db(db_connection, seeded_shoppers) -> Generator:
+    """
+    Create a new database session for each test and roll it back after the test.
+
+    The test runs inside a SAVEPOINT on the shared connection, opened after
+    the shoppers are seeded. The session commits into savepoints of its own,
+    so rolling back the outer one discards everything the test wrote while
+    keeping the seeded rows.
+    """
+    savepoint = db_connection.begin_nested()
+    session = TestingSessionLocal(
+        bind=db_connection, join_transaction_mode="create_savepoint"
+    )
+
+    yield session
+
+    session.close()
+    savepoint.rollback()
+
+
 @pytest.fixture(autouse=True)
 def set_session_for_factories(db: Session):
     """Attaches the mock session to the factories"""
     ShopperFactory._meta.sqlalchemy_session = db
     VendorFactory._meta.sqlalchemy_session = db
+    ProductFactory._meta.sqlalchemy_session = db
+
+
+@pytest.fixture(scope="function")
+def count_queries(db: Session) -> Generator[List[str], None, None]:
+    """
+    Record every SQL statement executed on the test connection.
+
+    Tests clear the list right before the code under test and assert on its
+    length, so N+1 query regressions fail the suite.
+    """
+    statements = []
+
+    def before_cursor_execute(
+        conn, cursor, statement, parameters, context, executemany
+    ):
+        statements.append(statement)
+
+    connection = db.connection()
+    event.listen(connection, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(connection, "before_cursor_execute", before_cursor_execute)
 
 
 @pytest.fixture(scope="function")
@@ -116,3 +205,11 @@ def shopper(db: Session) -> Shopper:
 def vendor(db: Session) -> Vendor:
     """Create a test vendor"""
     return VendorFactory()
+
+
+@pytest.fixture
+def fake_cache(monkeypatch) -> FakeRedis:
+    """Enable the cache helpers against an in-memory Redis stand-in"""
+    client = FakeRedis()
+    monkeypatch.setattr(cache, "redis_client", client)
+    return client
@@ -0,0 +1,22 @@
+"""Factory for producing test products"""
+
+import factory
+from app.services.product.model import Product, ProductCategory, ProductStatus
+
+
+class ProductFactory(factory.alchemy.SQLAlchemyModelFactory):
+    """Product factory"""
+
+    class Meta:
+        """Factory meta data"""
+
+        model = Product  # SQLAlchemy model
+        sqlalchemy_session_persistence = "commit"
+
+    # Faker properties
+    name = factory.Faker("word")
+    price = factory.Faker("pyfloat", min_value=1.0, max_value=500.0, right_digits=2)
+    description = factory.Faker("sentence")
+    category = ProductCategory.OTHER
+    tags = factory.LazyFunction(list)
+    status = ProductStatus.ACTIVE
@@ -1,8 +1,9 @@
 """Factory for producing test users"""
 
-from datetime import datetime
+import hashlib
 import factory
 from app.core.db.user import Shopper, UserStatus, Vendor
+from app.core.utils.dates import utc_now
 
 
 class ShopperFactory(factory.alchemy.SQLAlchemyModelFactory):
@@ -20,16 +21,41 @@ class ShopperFactory(factory.alchemy.SQLAlchemyModelFactory):
     name = factory.Faker("name")
     phone_number = factory.Faker("phone_number")
     email = factory.Faker("email")
-    password_hash = factory.Faker("sha256")
+    password_hash = factory.Sequence(
+        lambda n: hashlib.sha256(n.to_bytes(8, "little")).hexdigest()
+    )
     status = UserStatus.ACTIVE
-    created_at = factory.LazyFunction(datetime.utcnow)
+    created_at = factory.LazyFunction(utc_now)
     last_login = None
-    preferences = {}
-    payment_methods = []
-    wishlist = []
-    search_history = []
-    order_history = []
-    locations = []
+    preferences = factory.LazyFunction(dict)
+    payment_methods = factory.LazyFunction(list)
+    wishlist = factory.LazyFunction(list)
+    search_history = factory.LazyFunction(list)
+    order_history = factory.LazyFunction(list)
+    locations = factory.LazyFunction(list)
+
+    class Params:
+        """Factory traits"""
+
+        # Skip Faker for tests that only need the row to exist
+        minimal = factory.Trait(
+            name="Shopper",
+            phone_number="0",
+            email=factory.Sequence(lambda n: f"shopper{n}@example.com"),
+        )
+
+    @classmethod
+    def create_batch_bulk(cls, size: int, **kwargs):
+        """Create several shoppers with one INSERT and a single commit.
+
+        create_batch commits every shopper separately, which dominates the
+        setup of tests that need many rows.
+        """
+        session = cls._meta.sqlalchemy_session
+        shoppers = cls.build_batch(size, **kwargs)
+        session.add_all(shoppers)
+        session.commit()
+        return shoppers
 
 
 class VendorFactory(factory.alchemy.SQLAlchemyModelFactory):
@@ -45,12 +71,14 @@ class VendorFactory(factory.alchemy.SQLAlchemyModelFactory):
     name = factory.Faker("company")
     phone_number = factory.Faker("phone_number")
     email = factory.Faker("company_email")
-    password_hash = factory.Faker("sha256")
+    password_hash = factory.Sequence(
+        lambda n: hashlib.sha256(n.to_bytes(8, "little")).hexdigest()
+    )
     status = UserStatus.ACTIVE
-    created_at = factory.LazyFunction(datetime.utcnow)
+    created_at = factory.LazyFunction(utc_now)
     last_login = None
     rating = factory.Faker("pyfloat", min_value=1.0, max_value=5.0)
-    bank_info = {}
+    bank_info = factory.LazyFunction(dict)
     comission = factory.Faker("pyfloat", min_value=0.0, max_value=0.3)
     specialty = factory.Faker("bs")
-    locations = []
+    locations = factory.LazyFunction(list)
@@ -0,0 +1,48 @@
+# pylint: disable=unused-argument
+"""In-memory fakes for external services used in tests"""
+
+from typing import Any, Dict
+
+
+class FakeRedis:
+    """In-memory stand-in for the few Redis commands the cache helpers use"""
+
+    def __init__(self):
+        self.store: Dict[str, Any] = {}
+
+    def get(self, key: str):
+        """GET"""
+        return self.store.get(key)
+
+    def set(self, key: str, value: str, ex: int = None):
+        """SET, ignoring the expiration"""
+        self.store[key] = value
+
+    def hget(self, key: str, field: str):
+        """HGET"""
+        return self.store.get(key, {}).get(field)
+
+    def hset(self, key: str, field: str, value: str):
+        """HSET"""
+        self.store.setdefault(key, {})[field] = value
+
+    def expire(self, key: str, ttl: int):
+        """EXPIRE, a no-op since values never expire during a test"""
+
+    def delete(self, *keys: str):
+        """DEL"""
+        for key in keys:
+            self.store.pop(key, None)
+
+    def pipeline(self, transaction: bool = True):
+        """Commands are applied immediately, so the pipeline is the client"""
+        return self
+
+    def execute(self):
+        """Pipeline EXECUTE"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
@@ -0,0 +1,175 @@
+# pylint: disable=redefined-outer-name
+"""Test module for the PATCH routes of every resource."""
+
+from typing import Generator
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.core.auth.current_user import get_current_shopper_user, get_current_vendor_user
+from app.core.db.conn import get_session
+from app.core.db.user import Location, Shopper, Vendor
+from app.main import app
+from app.services.order.model import OrderCreate, OrderItemCreate, OrderPublic
+from app.services.order.service import OrderService
+from app.services.product.model import Product
+from app.tests.factories.products import ProductFactory
+
+NEW_PHONE = "555-000-1111"
+
+
+@pytest.fixture
+def api_client(
+    db: Session, shopper: Shopper, vendor: Vendor
+) -> Generator[TestClient, None, None]:
+    """Client authenticated as both test users, without running startup hooks"""
+
+    def override_get_db():
+        yield db
+
+    app.dependency_overrides[get_session] = override_get_db
+    app.dependency_overrides[get_current_shopper_user] = lambda: shopper
+    app.dependency_overrides[get_current_vendor_user] = lambda: vendor
+    # Not entered as a context manager, so seeding and pool warming don't run
+    yield TestClient(app)
+
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def product(vendor: Vendor) -> Product:
+    """Create a product owned by the test vendor"""
+    return ProductFactory(vendor_id=vendor.id)
+
+
+@pytest.fixture
+def order(db: Session, shopper: Shopper, product: Product) -> OrderPublic:
+    """Register an order with one unit of the test product"""
+    return OrderService(db).register_order(
+        shopper.id,
+        OrderCreate(
+            delivery_location=Location(
+                type="home",
+                street="Maple Avenue",
+                number="456",
+                zip_code="60007",
+                city="Chicago",
+                state="IL",
+                country="USA",
+            ),
+            subtotal=product.price,
+            total_value=product.price,
+            ordered_items=[OrderItemCreate(product_id=product.id, quantity=1)],
+        ),
+    )
+
+
+class TestUpdateRoutes:
+    """Partial and explicit-null PATCH requests on every resource"""
+
+    def test_update_shopper_partial(self, api_client: TestClient, shopper: Shopper):
+        """Tests fields left out of the body keep their values"""
+        # Act
+        response = api_client.patch(
+            f"/shoppers/{shopper.id}", json={"phone_number": NEW_PHONE}
+        )
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json()["phone_number"] == NEW_PHONE
+        assert response.json()["name"] == shopper.name
+
+    def test_update_shopper_explicit_null(
+        self, api_client: TestClient, shopper: Shopper
+    ):
+        """Tests a null for a NOT NULL column is ignored"""
+        # Act
+        response = api_client.patch(
+            f"/shoppers/{shopper.id}",
+            json={"name": None, "created_at": None, "phone_number": NEW_PHONE},
+        )
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json()["phone_number"] == NEW_PHONE
+        assert response.json()["name"] == shopper.name
+        assert response.json()["created_at"] is not None
+
+    def test_update_vendor_partial(self, api_client: TestClient, vendor: Vendor):
+        """Tests fields left out of the body keep their values"""
+        # Act
+        response = api_client.patch(
+            f"/vendors/{vendor.id}", json={"phone_number": NEW_PHONE}
+        )
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json()["phone_number"] == NEW_PHONE
+        assert response.json()["name"] == vendor.name
+
+    def test_update_vendor_explicit_null(self, api_client: TestClient, vendor: Vendor):
+        """Tests a null for a NOT NULL column is ignored"""
+        # Act
+        response = api_client.patch(
+            f"/vendors/{vendor.id}",
+            json={"name": None, "created_at": None, "phone_number": NEW_PHONE},
+        )
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json()["phone_number"] == NEW_PHONE
+        assert response.json()["name"] == vendor.name
+        assert response.json()["created_at"] is not None
+
+    def test_update_product_partial(self, api_client: TestClient, product: Product):
+        """Tests fields left out of the body keep their values"""
+        # Act
+        response = api_client.patch(f"/products/{product.id}", json={"stock": 7})
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json()["stock"] == 7
+        assert response.json()["name"] == product.name
+
+    def test_update_product_explicit_null(
+        self, api_client: TestClient, product: Product
+    ):
+        """Tests a null for a NOT NULL column is ignored"""
+        # Act
+        response = api_client.patch(
+            f"/products/{product.id}", json={"name": None, "stock": 7}
+        )
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json()["stock"] == 7
+        assert response.json()["name"] == product.name
+
+    def test_update_order_partial(self, api_client: TestClient, order: OrderPublic):
+        """Tests fields left out of the body keep their values"""
+        # Act
+        response = api_client.patch(
+            f"/orders/{order.id}", json={"tracking_number": "TRACK-1"}
+        )
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json()["tracking_number"] == "TRACK-1"
+        assert response.json()["subtotal"] == order.subtotal
+        assert len(response.json()["items"]) == 1
+
+    def test_update_order_explicit_null(
+        self, api_client: TestClient, order: OrderPublic
+    ):
+        """Tests a null for a NOT NULL column is ignored"""
+        # Act
+        response = api_client.patch(
+            f"/orders/{order.id}",
+            json={"subtotal": None, "tracking_number": "TRACK-1"},
+        )
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json()["tracking_number"] == "TRACK-1"
+        assert response.json()["subtotal"] == order.subtotal
@@ -0,0 +1,168 @@
+"""Test module for the OrderService class."""
+
+from typing import List
+
+import pytest
+from sqlalchemy import func
+from sqlmodel import Session, select
+
+from app.core.db.user import Location
+from app.core.utils.exceptions import BadRequest
+from app.services.order.model import OrderCreate, OrderItemCreate, OrderUpdate
+from app.services.order.service import (
+    OrderService,
+    order_cache_key,
+    order_list_cache_key,
+)
+from app.services.product.model import Product
+from app.tests.fakes import FakeRedis
+from app.tests.factories.products import ProductFactory
+from app.tests.factories.users import ShopperFactory
+
+DELIVERY_LOCATION = Location(
+    type="home",
+    street="Maple Avenue",
+    number="456",
+    zip_code="60007",
+    city="Chicago",
+    state="IL",
+    country="USA",
+)
+
+
+def build_order(products: List[Product]) -> OrderCreate:
+    """Build order data with one unit of each given product"""
+    total = sum(product.price for product in products)
+    return OrderCreate(
+        delivery_location=DELIVERY_LOCATION,
+        subtotal=total,
+        total_value=total,
+        ordered_items=[
+            OrderItemCreate(
+                product_id=product.id,
+                quantity=1,
+                unit_price=product.price,
+                total_price=product.price,
+            )
+            for product in products
+        ],
+    )
+
+
+class TestOrderService:
+    """Test cases for OrderService functionality"""
+
+    def test_get_orders_query_count(self, db: Session, count_queries: List[str]):
+        """Tests that listing orders doesn't issue a query per order"""
+        # Arrange
+        service = OrderService(db)
+        shopper_id = ShopperFactory().id
+        order_data = build_order(ProductFactory.create_batch(2))
+        for _ in range(3):
+            service.register_order(shopper_id, order_data)
+        count_queries.clear()
+
+        # Act
+        page = service.get_orders(limit=50, shopper_id=shopper_id)
+
+        # Assert - one query for the orders and one for all of their items
+        assert len(page.items) == 3
+        assert all(len(order.items) == 2 for order in page.items)
+        assert len(count_queries) <= 2
+
+    def test_register_order_query_count(self, db: Session, count_queries: List[str]):
+        """Tests that registering an order doesn't issue a query per item"""
+        # Arrange
+        service = OrderService(db)
+        shopper_id = ShopperFactory().id
+        products = ProductFactory.create_batch(5)
+        single_item_order = build_order(products[:1])
+        multiple_items_order = build_order(products)
+
+        # Act
+        count_queries.clear()
+        service.register_order(shopper_id, single_item_order)
+        single_item_queries = len(count_queries)
+
+        count_queries.clear()
+        service.register_order(shopper_id, multiple_items_order)
+        multiple_items_queries = len(count_queries)
+
+        # Assert
+        assert multiple_items_queries == single_item_queries
+
+    def test_register_order_product_not_found(
+        self, db: Session, count_queries: List[str]
+    ):
+        """Tests registering an order with products that don't exist"""
+        # Arrange
+        service = OrderService(db)
+        shopper_id = ShopperFactory().id
+        order_data = build_order([ProductFactory()])
+        missing_id = db.scalar(select(func.max(Product.id))) + 1
+        order_data.ordered_items.append(
+            OrderItemCreate(
+                product_id=missing_id, quantity=1, unit_price=1, total_price=1
+            )
+        )
+        count_queries.clear()
+
+        # Act & Assert
+        with pytest.raises(BadRequest) as exc_info:
+            service.register_order(shopper_id, order_data)
+        assert str(missing_id) in str(exc_info.value.detail)
+        assert len(count_queries) == 1
+
+    def test_get_orders_cached(
+        self, db: Session, fake_cache: FakeRedis, count_queries: List[str]
+    ):
+        """Tests a repeated listing is served from the cache"""
+        # Arrange
+        service = OrderService(db)
+        shopper_id = ShopperFactory().id
+        service.register_order(shopper_id, build_order([ProductFactory()]))
+        service.get_orders(limit=10, shopper_id=shopper_id)
+        count_queries.clear()
+
+        # Act
+        page = service.get_orders(limit=10, shopper_id=shopper_id)
+
+        # Assert
+        assert len(page.items) == 1
+        assert order_list_cache_key(shopper_id) in fake_cache.store
+        assert not count_queries
+
+    def test_register_order_evicts_listings(self, db: Session, fake_cache: FakeRedis):
+        """Tests registering an order drops the cached listings it appears in"""
+        # Arrange
+        service = OrderService(db)
+        shopper_id = ShopperFactory().id
+        order_data = build_order([ProductFactory()])
+        service.register_order(shopper_id, order_data)
+        service.get_orders(limit=10)
+        service.get_orders(limit=10, shopper_id=shopper_id)
+
+        # Act
+        service.register_order(shopper_id, order_data)
+
+        # Assert
+        assert order_list_cache_key() not in fake_cache.store
+        assert order_list_cache_key(shopper_id) not in fake_cache.store
+        assert len(service.get_orders(limit=10, shopper_id=shopper_id).items) == 2
+
+    def test_update_order_evicts_cache(self, db: Session, fake_cache: FakeRedis):
+        """Tests updating an order drops its cached copy and listings"""
+        # Arrange
+        service = OrderService(db)
+        shopper_id = ShopperFactory().id
+        order = service.register_order(shopper_id, build_order([ProductFactory()]))
+        service.get_order_id(order.id)
+        service.get_orders(limit=10, shopper_id=shopper_id)
+
+        # Act
+        service.update_order(order.id, OrderUpdate(tracking_number="TRACK-1"))
+
+        # Assert
+        assert order_cache_key(order.id) not in fake_cache.store
+        assert order_list_cache_key(shopper_id) not in fake_cache.store
+        assert service.get_order_id(order.id).tracking_number == "TRACK-1"
@@ -1,42 +1,111 @@
+# pylint: disable=redefined-outer-name
 """Test module for the ShopperService class."""
 
+from typing import List
+
 import pytest
-from sqlmodel import Session
+from sqlalchemy import func
+from sqlmodel import Session, select
 
-from app.core.db.user import ShopperUpdate
-from app.core.utils.exceptions import NotFound
-from app.services.shopper.service import ShopperService
+from app.core.db.user import Location, Shopper, ShopperPublic, ShopperUpdate
+from app.core.utils.exceptions import Conflict, NotFound
+from app.services.order.model import Order, OrderCreate, OrderItemCreate
+from app.services.order.service import OrderService
+from app.services.shopper.service import ShopperService, shopper_cache_key
+from app.tests.factories.products import ProductFactory
+from app.tests.fakes import FakeRedis
 from app.tests.factories.users import ShopperFactory
 
+USER_NOT_FOUND_MSG = "User not found"
+# Update payloads are never mutated by the service, so tests can share them
+UPDATE_DATA = ShopperUpdate(
+    name="Updated Full Name",
+    phone_number="555-123-4567",
+    email="updated@example.com",
+)
+UPDATE_DATA_MINIMAL = ShopperUpdate(name="UpdatedFirstName")
+
+
+@pytest.fixture
+def non_existent_id(db: Session) -> int:
+    """An ID no shopper has: one past the highest in the table"""
+    return (db.scalar(select(func.max(Shopper.id))) or 0) + 1
+
+
+@pytest.fixture
+def service(db: Session) -> ShopperService:
+    """A ShopperService bound to the test's session"""
+    return ShopperService(db)
+
 
 class TestShopperService:
     """Test cases for ShopperService functionality"""
 
-    def test_get_shoppers(self, db: Session):
-        """Tests retrieving all shoppers"""
+    def test_get_shoppers(
+        self, service: ShopperService, seeded_shoppers: List[Shopper]
+    ):
+        """Tests retrieving the newest shoppers"""
         # Arrange
-        service = ShopperService(db)
-        # Create multiple shoppers
-        shopper1 = ShopperFactory()
-        shopper2 = ShopperFactory()
-        shopper3 = ShopperFactory()
+        seeded_ids = {shopper.id for shopper in seeded_shoppers}
 
         # Act
-        shoppers = service.get_shoppers()
+        # Newest first, and every row written after the seeding is rolled back,
+        # so a page the size of the pool holds exactly the seeded shoppers
+        shoppers = service.get_shoppers(limit=len(seeded_shoppers)).items
 
         # Assert
-        assert len(shoppers) >= 3
-        # Verify that our created shoppers are in the results
-        shopper_ids = [shopper.id for shopper in shoppers]
-        assert shopper1.id in shopper_ids
-        assert shopper2.id in shopper_ids
-        assert shopper3.id in shopper_ids
-
-    def test_get_shopper_id_found(self, db: Session):
+        assert {shopper.id for shopper in shoppers} == seeded_ids
+
+    def test_get_shoppers_paginates(self, service: ShopperService):
+        """Tests following the cursor returns the next shoppers without repeats"""
+        # Act
+        # The seeded pool holds more than one page of shoppers
+        first_page = service.get_shoppers(limit=2)
+        second_page = service.get_shoppers(limit=2, cursor=first_page.next_cursor)
+
+        # Assert
+        assert len(first_page.items) == 2
+        assert first_page.next_cursor is not None
+        assert second_page.items
+        first_ids = {shopper.id for shopper in first_page.items}
+        assert first_ids.isdisjoint(shopper.id for shopper in second_page.items)
+
+    def test_get_shoppers_public_fields(self, service: ShopperService):
+        """Tests listed shoppers expose exactly the ShopperPublic fields"""
+        # Arrange
+        shopper = ShopperFactory(
+            locations=[
+                {
+                    "type": "house",
+                    "street": "Main St",
+                    "number": "42",
+                    "zip_code": "12345",
+                    "city": "Springfield",
+                    "state": "IL",
+                    "country": "USA",
+                }
+            ]
+        )
+        shopper_id = shopper.id
+
+        # Act
+        shoppers = service.get_shoppers(limit=1).items
+
+        # Assert
+        listed = shoppers[0]
+        assert listed.id == shopper_id
+        assert isinstance(listed, ShopperPublic)
+        dumped = listed.model_dump()
+        assert set(dumped) == set(ShopperPublic.model_fields)
+        assert "password_hash" not in dumped
+        assert dumped["locations"][0]["city"] == "Springfield"
+
+    def test_get_shopper_id_found(
+        self, service: ShopperService, seeded_shoppers: List[Shopper]
+    ):
         """Tests retrieving a shopper by ID when it exists"""
         # Arrange
-        service = ShopperService(db)
-        shopper = ShopperFactory()
+        shopper = seeded_shoppers[0]
 
         # Act
         retrieved_shopper = service.get_shopper_id(shopper.id)
@@ -45,22 +114,73 @@ class TestShopperService:
         assert retrieved_shopper.id == shopper.id
         assert retrieved_shopper.email == shopper.email
 
-    def test_get_shopper_id_not_found(self, db: Session):
-        """Tests retrieving a shopper by ID when it doesn't exist"""
+    def test_get_shopper_id_cached(
+        self,
+        db: Session,
+        service: ShopperService,
+        seeded_shoppers: List[Shopper],
+        fake_cache: FakeRedis,
+        count_queries: List[str],
+    ):
+        """Tests a second lookup is served from the cache"""
         # Arrange
-        service = ShopperService(db)
-        non_existent_id = 2233
+        shopper = seeded_shoppers[0]
+        service.get_shopper_id(shopper.id)
+        # Empty the identity map so a miss would have to query
+        db.expunge_all()
+        count_queries.clear()
 
-        # Act & Assert
-        with pytest.raises(NotFound) as exc_info:
-            service.get_shopper_id(non_existent_id)
-        assert "User not found" in str(exc_info.value.detail)
+        # Act
+        retrieved_shopper = service.get_shopper_id(shopper.id)
+
+        # Assert
+        assert retrieved_shopper.id == shopper.id
+        assert shopper_cache_key(shopper.id) in fake_cache.store
+        assert not count_queries
 
-    def test_get_shopper_email_found(self, db: Session):
+    def test_update_shopper_evicts_cache(
+        self,
+        service: ShopperService,
+        seeded_shoppers: List[Shopper],
+        fake_cache: FakeRedis,
+    ):
+        """Tests updating a shopper drops its cached copy"""
+        # Arrange
+        shopper = seeded_shoppers[0]
+        service.get_shopper_id(shopper.id)
+
+        # Act
+        service.update_shopper(shopper.id, UPDATE_DATA)
+
+        # Assert
+        assert shopper_cache_key(shopper.id) not in fake_cache.store
+        assert service.get_shopper_id(shopper.id).name == UPDATE_DATA.name
+
+    def test_delete_shopper_evicts_cache(
+        self,
+        service: ShopperService,
+        seeded_shoppers: List[Shopper],
+        fake_cache: FakeRedis,
+    ):
+        """Tests deleting a shopper drops its cached copy"""
+        # Arrange
+        shopper = seeded_shoppers[0]
+        service.get_shopper_id(shopper.id)
+
+        # Act
+        service.delete_shopper(shopper.id)
+
+        # Assert
+        assert shopper_cache_key(shopper.id) not in fake_cache.store
+        with pytest.raises(NotFound):
+            service.get_shopper_id(shopper.id)
+
+    def test_get_shopper_email_found(
+        self, service: ShopperService, seeded_shoppers: List[Shopper]
+    ):
         """Tests retrieving a shopper by email when it exists"""
         # Arrange
-        service = ShopperService(db)
-        shopper = ShopperFactory()
+        shopper = seeded_shoppers[0]
 
         # Act
         retrieved_shopper = service.get_shopper_email(shopper.email)
@@ -69,30 +189,15 @@ class TestShopperService:
         assert retrieved_shopper.id == shopper.id
         assert retrieved_shopper.email == shopper.email
 
-    def test_get_shopper_email_not_found(self, db: Session):
-        """Tests retrieving a shopper by email when it doesn't exist"""
-        # Arrange
-        service = ShopperService(db)
-        non_existent_email = "nonexistent@example.com"
-
-        # Act & Assert
-        with pytest.raises(NotFound) as exc_info:
-            service.get_shopper_email(non_existent_email)
-        assert "User not found" in str(exc_info.value.detail)
-
-    def test_update_shopper(self, db: Session):
+    def test_update_shopper(
+        self, service: ShopperService, seeded_shoppers: List[Shopper]
+    ):
         """Tests updating a shopper's information"""
         # Arrange
-        service = ShopperService(db)
-        shopper = ShopperFactory()
-        update_data = ShopperUpdate(
-            name="Updated Full Name",
-            phone_number="555-123-4567",
-            email="updated@example.com",
-        )
+        shopper = seeded_shoppers[0]
 
         # Act
-        updated_shopper = service.update_shopper(shopper.id, update_data)
+        updated_shopper = service.update_shopper(shopper.id, UPDATE_DATA)
 
         # Assert
         assert updated_shopper.id == shopper.id
@@ -100,23 +205,23 @@ class TestShopperService:
         assert updated_shopper.phone_number == "555-123-4567"
         assert updated_shopper.email == "updated@example.com"
 
-    def test_update_shopper_not_found(self, db: Session):
-        """Tests updating a shopper that doesn't exist"""
+    def test_update_shopper_email_in_use(
+        self, service: ShopperService, seeded_shoppers: List[Shopper]
+    ):
+        """Tests taking another shopper's email is rejected as a conflict"""
         # Arrange
-        service = ShopperService(db)
-        non_existent_id = 2233
-        update_data = ShopperUpdate(name="UpdatedFirstName")
+        shopper, other = seeded_shoppers[:2]
 
         # Act & Assert
-        with pytest.raises(NotFound) as exc_info:
-            service.update_shopper(non_existent_id, update_data)
-        assert "User not found" in str(exc_info.value.detail)
+        with pytest.raises(Conflict):
+            service.update_shopper(shopper.id, ShopperUpdate(email=other.email))
 
-    def test_delete_shopper(self, db: Session):
+    def test_delete_shopper(
+        self, service: ShopperService, seeded_shoppers: List[Shopper]
+    ):
         """Tests deleting a shopper"""
         # Arrange
-        service = ShopperService(db)
-        shopper = ShopperFactory()
+        shopper = seeded_shoppers[0]
 
         # Act
         service.delete_shopper(shopper.id)
@@ -125,13 +230,58 @@ class TestShopperService:
         with pytest.raises(NotFound):
             service.get_shopper_id(shopper.id)
 
-    def test_delete_shopper_not_found(self, db: Session):
-        """Tests deleting a shopper that doesn't exist"""
+    def test_delete_shopper_with_order(self, db: Session, service: ShopperService):
+        """Tests deleting a shopper who placed an order keeps the order"""
         # Arrange
-        service = ShopperService(db)
-        non_existent_id = 2233
+        shopper_id = ShopperFactory().id
+        product = ProductFactory()
+        order = OrderService(db).register_order(
+            shopper_id,
+            OrderCreate(
+                delivery_location=Location(
+                    type="home",
+                    street="Maple Avenue",
+                    number="456",
+                    zip_code="60007",
+                    city="Chicago",
+                    state="IL",
+                    country="USA",
+                ),
+                subtotal=product.price,
+                total_value=product.price,
+                ordered_items=[OrderItemCreate(product_id=product.id, quantity=1)],
+            ),
+        )
+
+        # Act
+        service.delete_shopper(shopper_id)
+
+        # Assert - the order remains, detached from the deleted shopper
+        with pytest.raises(NotFound):
+            service.get_shopper_id(shopper_id)
+        remaining = db.execute(
+            select(Order.id, Order.shopper_id).where(Order.id == order.id)
+        ).one()
+        assert remaining.shopper_id is None
 
+    @pytest.mark.parametrize(
+        "operation",
+        [
+            lambda service, missing_id: service.get_shopper_id(missing_id),
+            lambda service, missing_id: service.get_shopper_email(
+                "nonexistent@example.com"
+            ),
+            lambda service, missing_id: service.update_shopper(
+                missing_id, UPDATE_DATA_MINIMAL
+            ),
+            lambda service, missing_id: service.delete_shopper(missing_id),
+        ],
+        ids=["get_by_id", "get_by_email", "update", "delete"],
+    )
+    def test_shopper_not_found(
+        self, service: ShopperService, non_existent_id: int, operation
+    ):
+        """Tests every lookup and mutation raises NotFound for a missing shopper"""
         # Act & Assert
-        with pytest.raises(NotFound) as exc_info:
-            service.delete_shopper(non_existent_id)
-        assert "User not found" in str(exc_info.value.detail)
+        with pytest.raises(NotFound, match=f"{USER_NOT_FOUND_MSG}$"):
+            operation(service, non_existent_id)
@@ -0,0 +1,32 @@
+"""Test module for the VendorService class."""
+
+import pytest
+from sqlmodel import Session, select
+
+from app.core.utils.exceptions import NotFound
+from app.services.product.model import Product
+from app.services.vendor.service import VendorService
+from app.tests.factories.products import ProductFactory
+from app.tests.factories.users import VendorFactory
+
+
+class TestVendorService:
+    """Test cases for VendorService functionality"""
+
+    def test_delete_vendor_with_product(self, db: Session):
+        """Tests deleting a vendor who lists a product keeps the product"""
+        # Arrange
+        service = VendorService(db)
+        vendor_id = VendorFactory().id
+        product_id = ProductFactory(vendor_id=vendor_id).id
+
+        # Act
+        service.delete_vendor(vendor_id)
+
+        # Assert - the product remains, detached from the deleted vendor
+        with pytest.raises(NotFound):
+            service.get_vendor_id(vendor_id)
+        remaining = db.execute(
+            select(Product.id, Product.vendor_id).where(Product.id == product_id)
+        ).one()
+        assert remaining.vendor_id is None
@@ -0,0 +1,33 @@
+"""Add composite index on order shopper_id and created_at
+
+Revision ID: 5c1e7a9d2b40
+Revises: 04de13eaa09b
+Create Date: 2026-10-16 10:12:31.418205
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5c1e7a9d2b40"
+down_revision: Union[str, None] = "04de13eaa09b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_order_shopper_created",
+        "order",
+        ["shopper_id", "created_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_order_shopper_created", table_name="order")
@@ -0,0 +1,33 @@
+"""Add composite index on product created_at and id
+
+Revision ID: 8e3f21c6d7a5
+Revises: 5c1e7a9d2b40
+Create Date: 2026-10-16 14:03:52.671940
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8e3f21c6d7a5"
+down_revision: Union[str, None] = "5c1e7a9d2b40"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_product_created_id",
+        "product",
+        ["created_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_product_created_id", table_name="product")
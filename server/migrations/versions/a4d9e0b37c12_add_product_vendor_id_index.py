@@ -0,0 +1,41 @@
+"""Add composite index on product vendor_id and id
+
+Revision ID: a4d9e0b37c12
+Revises: 8e3f21c6d7a5
+Create Date: 2026-10-16 15:27:09.114382
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a4d9e0b37c12"
+down_revision: Union[str, None] = "8e3f21c6d7a5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY avoids locking product writes, but can't run in a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_product_vendor_id",
+            "product",
+            ["vendor_id", "id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_product_vendor_id",
+            table_name="product",
+            postgresql_concurrently=True,
+        )
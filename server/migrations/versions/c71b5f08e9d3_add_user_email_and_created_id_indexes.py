@@ -0,0 +1,56 @@
+"""Add email and created_at/id indexes on shopper and vendor
+
+The email indexes are unique. Databases holding duplicate emails must be
+deduplicated first; the upgrade stops and lists them instead of failing
+on the index build.
+
+Revision ID: c71b5f08e9d3
+Revises: a4d9e0b37c12
+Create Date: 2026-10-16 17:48:21.530716
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c71b5f08e9d3"
+down_revision: Union[str, None] = "a4d9e0b37c12"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+    for table in ("shopper", "vendor"):
+        duplicates = (
+            bind.execute(
+                sa.text(
+                    f"SELECT email FROM {table} GROUP BY email HAVING COUNT(*) > 1"
+                )
+            )
+            .scalars()
+            .all()
+        )
+        if duplicates:
+            raise RuntimeError(
+                f"Cannot add a unique index on {table}.email, "
+                f"resolve these duplicated emails first: {duplicates}"
+            )
+
+    for table in ("shopper", "vendor"):
+        op.create_index(f"ix_{table}_email", table, ["email"], unique=True)
+        op.create_index(
+            f"ix_{table}_created_id", table, ["created_at", "id"], unique=False
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in ("shopper", "vendor"):
+        op.drop_index(f"ix_{table}_created_id", table_name=table)
+        op.drop_index(f"ix_{table}_email", table_name=table)